@@ -16,31 +16,289 @@ Usage:
 """
 
 import sys
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Check Python version and warn about unstable versions
-if sys.version_info >= (3, 14) and "a" in sys.version.lower():
-    print("\n⚠️  WARNING: You are using Python 3.14 alpha version!")
-    print("   This may cause crashes with some dependencies (pydantic).")
-    print("   Recommended: Use Python 3.10, 3.11, 3.12, or 3.13 stable release.\n")
-    response = input("Continue anyway? (yes/no) [no]: ").strip().lower()
-    if response not in ['yes', 'y']:
-        print("Exiting. Please use a stable Python version.")
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from src.config import Config
+
+# src.config (and with it pydantic) is imported lazily by the methods that
+# need it, so the version warning below is shown without paying that cost.
+
+_SEP70 = "=" * 70
+_SEP60 = "=" * 60
+_DASH40 = "-" * 40
+
+_WELCOME_TEXT = f"""
+{_SEP70}
+               🎬 MKV to MP4 Converter
+               Configuration Manager
+{_SEP70}
+
+📝 About config.yaml:
+   The config.yaml file controls how your videos are converted.
+   You can customize:
+   • Video quality (resolution, codec, quality level)
+   • Audio settings (codec, bitrate)
+   • Subtitle preferences (language, styling)
+   • Processing options (parallel processing, etc.)
+
+💡 Tips:
+   • Lower CRF value = Better quality but larger file size
+   • Higher resolution = Better quality but slower conversion
+   • Enable parallel processing if you have a multi-core CPU
+{_SEP70}"""
+
+_HELP_TEXT = f"""
+{_SEP70}
+📚 Configuration Help & Tips
+{_SEP70}
+
+🎬 VIDEO SETTINGS:
+   Resolution:
+     • 480p  - Smaller files, faster encoding (SD quality)
+     • 720p  - Good balance of quality and file size (HD)
+     • 1080p - High quality, larger files (Full HD)
+
+   CRF (Constant Rate Factor):
+     • 18-20 - Very high quality (large files)
+     • 23-24 - Good quality (recommended)
+     • 28-30 - Lower quality (smaller files)
+
+   Codec:
+     • libx264 - H.264 codec, best compatibility
+     • libx265 - H.265/HEVC, better compression but slower
+
+   Preset:
+     • fast/faster   - Quick encoding, larger files
+     • medium        - Balanced (recommended)
+     • slow/slower   - Better compression, takes longer
+
+🔊 AUDIO SETTINGS:
+   • AAC (128k-192k) - Best compatibility and quality
+   • MP3 (128k-320k) - Universal compatibility
+
+📝 SUBTITLE SETTINGS:
+   • Enabled: Subtitles are burned into the video permanently
+   • Language: Use 3-letter codes (eng, tha, jpn, chi, etc.)
+   • Leave blank to use default subtitle track
+
+⚙️  PROCESSING OPTIONS:
+   • Parallel Processing: Process multiple files at once
+     WARNING: Uses more CPU and RAM
+   • Max Workers: How many files to process simultaneously
+     Recommended: Number of CPU cores - 1
+   • Skip Existing: Don't re-convert files that already exist
+
+💡 COMMON PRESETS:
+   Small Files, Fast:  480p, CRF 28, preset fast
+   Balanced Quality:   480p, CRF 24, preset medium
+   High Quality:       720p, CRF 20, preset slow
+   Archive Quality:    1080p, CRF 18, preset slower"""
+
+_MAIN_MENU = """
+📋 Main Menu:
+  1. View current configuration
+  2. 🚀 Quick Setup Wizard (Easy configuration)
+  3. Update directory settings
+  4. Update video settings
+  5. Update audio settings
+  6. Update subtitle settings
+  7. Update processing options
+  8. Save configuration
+  9. Reset to defaults
+  R. Reload configuration from file
+  H. Show help and tips
+  0. Exit"""
+
+_CONFIG_TEMPLATE = f"""
+{_SEP60}
+CURRENT CONFIGURATION
+{_SEP60}
+
+📁 Directory Settings:
+   Input Folder:    {{config.input_folder}}
+   Output Folder:   {{config.output_folder}}
+   Logs Folder:     {{config.logs_folder}}
+
+🎬 Video Settings:
+   Resolution:      {{config.video.resolution}}p
+   Codec:           {{config.video.codec}}
+   CRF (Quality):   {{config.video.crf}}
+   Preset:          {{config.video.preset}}
+   Hardware Accel:  {{config.video.hardware_accel}}
+
+🔊 Audio Settings:
+   Codec:           {{config.audio.codec}}
+   Bitrate:         {{config.audio.bitrate}}
+
+📝 Subtitle Settings:
+   Enabled:         {{config.subtitles.enabled}}
+   Language:        {{language}}
+   Force Style:     {{force_style}}
+
+⚙️  Processing Options:
+   Parallel:        {{config.parallel_processing}}
+   Max Workers:     {{config.max_workers}}
+   Skip Existing:   {{config.skip_existing}}
+   Verbose:         {{config.verbose}}
+{_SEP60}
+"""
+
+_YES = frozenset({"yes", "y", "true", "1"})
+_NO = frozenset({"no", "n", "false", "0"})
+
+
+def _prompt_bool(prompt: str, default: bool) -> bool:
+    """Ask a yes/no question, asking again until the answer is recognised.
+
+    Args:
+        prompt: Text shown to the user
+        default: Value returned for a blank answer
+
+    Returns:
+        bool: True for a yes-like answer, False for a no-like answer
+    """
+    while True:
+        response = input(prompt).strip().lower()
+        if not response:
+            return default
+        if response in _YES:
+            return True
+        if response in _NO:
+            return False
+        print("✗ Please answer yes or no.")
+
+
+def _check_python_version() -> None:
+    """Warn about unstable Python versions and let the user bail out."""
+    if sys.version_info >= (3, 14) and sys.version_info.releaselevel != "final":
+        print(
+            "\n⚠️  WARNING: You are using a Python 3.14+ pre-release!\n"
+            "   This may cause crashes with some dependencies (pydantic).\n"
+            "   Recommended: Use Python 3.10, 3.11, 3.12, or 3.13 stable release.\n"
+        )
+        if not _prompt_bool("Continue anyway? (yes/no) [no]: ", False):
+            print("Exiting. Please use a stable Python version.")
+            sys.exit(1)
+
+
+def _check_config_modules() -> None:
+    """Import the configuration modules, exiting with hints on failure."""
+    try:
+        import src.config  # noqa: F401
+    except Exception as e:
+        print(
+            f"\n❌ Error loading configuration modules: {e}\n"
+            "\nPossible solutions:\n"
+            "  1. Install dependencies: uv sync\n"
+            "  2. Use a stable Python version (3.10-3.13)\n"
+            "  3. Check if pydantic is installed correctly"
+        )
         sys.exit(1)
 
-try:
-    from src.config import load_config, save_config, Config, VideoConfig, AudioConfig, SubtitleConfig
-except Exception as e:
-    print(f"\n❌ Error loading configuration modules: {e}")
-    print("\nPossible solutions:")
-    print("  1. Install dependencies: uv sync")
-    print("  2. Use a stable Python version (3.10-3.13)")
-    print("  3. Check if pydantic is installed correctly")
-    sys.exit(1)
+
+@dataclass(frozen=True)
+class _FieldPrompt:
+    """Prompt definition for one validated config field.
+
+    Attributes:
+        label: Prompt text shown before the current value
+        section: Config sub-model holding the field, None for top level
+        field: Name of the field to update
+        hint: Optional text shown above the prompt
+    """
+
+    label: str
+    section: Optional[str]
+    field: str
+    hint: str = ""
+
+
+_DIRECTORY_FIELDS = (
+    _FieldPrompt("Input folder", None, "input_folder"),
+    _FieldPrompt("Output folder", None, "output_folder"),
+    _FieldPrompt("Logs folder", None, "logs_folder"),
+)
+
+_VIDEO_FIELDS = (
+    _FieldPrompt("Resolution (144-2160)", "video", "resolution"),
+    _FieldPrompt(
+        "Video codec", "video", "codec",
+        hint="\nAvailable codecs: libx264, libx265, h264, hevc\n",
+    ),
+    _FieldPrompt("CRF quality (0-51, lower=better)", "video", "crf"),
+    _FieldPrompt(
+        "Encoding preset", "video", "preset",
+        hint="\nAvailable presets: ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow\n",
+    ),
+    _FieldPrompt(
+        "Hardware acceleration", "video", "hardware_accel",
+        hint="\nAvailable backends: none, auto, nvenc, videotoolbox, qsv, vaapi\n",
+    ),
+)
+
+_AUDIO_FIELDS = (
+    _FieldPrompt(
+        "Audio codec", "audio", "codec",
+        hint="Available codecs: aac, mp3, opus, ac3\n",
+    ),
+    _FieldPrompt("Audio bitrate (e.g., 128k, 192k)", "audio", "bitrate"),
+)
+
+_MAX_WORKERS_FIELD = _FieldPrompt("Max workers (1-16)", None, "max_workers")
+
+
+@cache
+def _default_config() -> "Config":
+    """Build the default configuration once.
+
+    Returns:
+        Config: Shared default configuration (copy before mutating)
+    """
+    from src.config import Config
+
+    return Config()
+
+
+# Readable explanations for fields validated by a regex pattern
+_PATTERN_HINTS = {
+    "bitrate": "Invalid bitrate format '{value}'. Use a number ending with 'k' or 'M' (e.g., '128k', '0.5M')",
+}
+
+
+def _assign_validated(model: "BaseModel", field: str, value: str) -> bool:
+    """Validate a single field against the model schema and assign it.
+
+    Args:
+        model: Config sub-model to update in place
+        field: Name of the field to set
+        value: Raw user input for the field
+
+    Returns:
+        bool: True if the value was accepted, False if it was rejected
+    """
+    from pydantic import ValidationError
+
+    try:
+        type(model).__pydantic_validator__.validate_assignment(model, field, value)
+        return True
+    except ValidationError as e:
+        error = e.errors()[0]
+        # Pattern errors only quote the regex, so explain the format instead
+        if error["type"] == "string_pattern_mismatch" and field in _PATTERN_HINTS:
+            message = _PATTERN_HINTS[field].format(value=value)
+        else:
+            message = error["msg"]
+        print(f"✗ {message}. Keeping current value.")
+        return False
 
 
 class ConfigManager:
@@ -53,22 +311,38 @@ class ConfigManager:
             config_path: Path to the configuration file
         """
         self.config_path = Path(config_path)
-        self.config: Optional[Config] = None
+        self.config: Optional["Config"] = None
         self.is_first_run = not self.config_path.exists()
+        self._actions: dict[str, Callable[[], None]] = {
+            "1": self.display_config,
+            "2": self.quick_setup_wizard,
+            "3": self.update_directories,
+            "4": self.update_video_settings,
+            "5": self.update_audio_settings,
+            "6": self.update_subtitle_settings,
+            "7": self.update_processing_options,
+            "8": self.save_configuration,
+            "9": self.reset_to_defaults,
+            "r": self.load_configuration,
+            "h": self.show_help,
+        }
         self.load_configuration()
 
     def load_configuration(self) -> None:
         """Load the current configuration."""
+        from src.config import load_config
+
         try:
             self.config = load_config(self.config_path)
             print(f"✓ Configuration loaded from {self.config_path}")
         except Exception as e:
-            print(f"✗ Error loading configuration: {e}")
-            print("  Using default configuration")
-            self.config = Config()
+            print(f"✗ Error loading configuration: {e}\n  Using default configuration")
+            self.config = _default_config().model_copy(deep=True)
 
     def save_configuration(self) -> None:
         """Save the current configuration."""
+        from src.config import save_config
+
         try:
             save_config(self.config, self.config_path)
             print(f"✓ Configuration saved to {self.config_path}")
@@ -77,143 +351,50 @@ class ConfigManager:
 
     def display_config(self) -> None:
         """Display current configuration."""
-        print("\n" + "=" * 60)
-        print("CURRENT CONFIGURATION")
-        print("=" * 60)
-        print(f"\n📁 Directory Settings:")
-        print(f"   Input Folder:    {self.config.input_folder}")
-        print(f"   Output Folder:   {self.config.output_folder}")
-        print(f"   Logs Folder:     {self.config.logs_folder}")
-
-        print(f"\n🎬 Video Settings:")
-        print(f"   Resolution:      {self.config.video.resolution}p")
-        print(f"   Codec:           {self.config.video.codec}")
-        print(f"   CRF (Quality):   {self.config.video.crf}")
-        print(f"   Preset:          {self.config.video.preset}")
-
-        print(f"\n🔊 Audio Settings:")
-        print(f"   Codec:           {self.config.audio.codec}")
-        print(f"   Bitrate:         {self.config.audio.bitrate}")
-
-        print(f"\n📝 Subtitle Settings:")
-        print(f"   Enabled:         {self.config.subtitles.enabled}")
-        print(f"   Language:        {self.config.subtitles.language or 'Default'}")
-        print(f"   Force Style:     {self.config.subtitles.force_style or 'None'}")
-
-        print(f"\n⚙️  Processing Options:")
-        print(f"   Parallel:        {self.config.parallel_processing}")
-        print(f"   Max Workers:     {self.config.max_workers}")
-        print(f"   Skip Existing:   {self.config.skip_existing}")
-        print(f"   Verbose:         {self.config.verbose}")
-        print("=" * 60 + "\n")
+        print(_CONFIG_TEMPLATE.format(
+            config=self.config,
+            language=self.config.subtitles.language or "Default",
+            force_style=self.config.subtitles.force_style or "None",
+        ))
 
-    def update_directories(self) -> None:
-        """Update directory settings."""
-        print("\n📁 Directory Settings")
-        print("-" * 40)
-
-        input_folder = input(f"Input folder [{self.config.input_folder}]: ").strip()
-        if input_folder:
-            self.config.input_folder = Path(input_folder)
+    def _prompt_fields(self, fields: tuple[_FieldPrompt, ...]) -> None:
+        """Prompt for each field in turn, keeping the value on blank input.
 
-        output_folder = input(f"Output folder [{self.config.output_folder}]: ").strip()
-        if output_folder:
-            self.config.output_folder = Path(output_folder)
-
-        logs_folder = input(f"Logs folder [{self.config.logs_folder}]: ").strip()
-        if logs_folder:
-            self.config.logs_folder = Path(logs_folder)
+        Args:
+            fields: Field prompt definitions to ask for
+        """
+        for spec in fields:
+            model = getattr(self.config, spec.section) if spec.section else self.config
+            value = input(f"{spec.hint}{spec.label} [{getattr(model, spec.field)}]: ").strip()
+            if value:
+                _assign_validated(model, spec.field, value)
 
+    def update_directories(self) -> None:
+        """Update directory settings."""
+        print(f"\n📁 Directory Settings\n{_DASH40}")
+        self._prompt_fields(_DIRECTORY_FIELDS)
         print("✓ Directory settings updated")
 
     def update_video_settings(self) -> None:
         """Update video encoding settings."""
-        print("\n🎬 Video Encoding Settings")
-        print("-" * 40)
-
-        resolution = input(f"Resolution (144-2160) [{self.config.video.resolution}]: ").strip()
-        if resolution:
-            try:
-                self.config.video.resolution = int(resolution)
-            except ValueError:
-                print("✗ Invalid resolution. Keeping current value.")
-
-        print("\nAvailable codecs: libx264, libx265, h264, hevc")
-        codec = input(f"Video codec [{self.config.video.codec}]: ").strip()
-        if codec:
-            try:
-                # Trigger validation by creating new VideoConfig
-                test_config = VideoConfig(
-                    resolution=self.config.video.resolution,
-                    codec=codec,
-                    crf=self.config.video.crf,
-                    preset=self.config.video.preset
-                )
-                self.config.video.codec = codec
-            except ValueError as e:
-                print(f"✗ {e}")
-
-        crf = input(f"CRF quality (0-51, lower=better) [{self.config.video.crf}]: ").strip()
-        if crf:
-            try:
-                crf_val = int(crf)
-                if 0 <= crf_val <= 51:
-                    self.config.video.crf = crf_val
-                else:
-                    print("✗ CRF must be between 0 and 51. Keeping current value.")
-            except ValueError:
-                print("✗ Invalid CRF. Keeping current value.")
-
-        print("\nAvailable presets: ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow")
-        preset = input(f"Encoding preset [{self.config.video.preset}]: ").strip()
-        if preset:
-            try:
-                test_config = VideoConfig(
-                    resolution=self.config.video.resolution,
-                    codec=self.config.video.codec,
-                    crf=self.config.video.crf,
-                    preset=preset
-                )
-                self.config.video.preset = preset
-            except ValueError as e:
-                print(f"✗ {e}")
-
+        print(f"\n🎬 Video Encoding Settings\n{_DASH40}")
+        self._prompt_fields(_VIDEO_FIELDS)
         print("✓ Video settings updated")
 
     def update_audio_settings(self) -> None:
         """Update audio encoding settings."""
-        print("\n🔊 Audio Encoding Settings")
-        print("-" * 40)
-
-        print("Available codecs: aac, mp3, opus, ac3")
-        codec = input(f"Audio codec [{self.config.audio.codec}]: ").strip()
-        if codec:
-            try:
-                test_config = AudioConfig(codec=codec, bitrate=self.config.audio.bitrate)
-                self.config.audio.codec = codec
-            except ValueError as e:
-                print(f"✗ {e}")
-
-        bitrate = input(f"Audio bitrate (e.g., 128k, 192k) [{self.config.audio.bitrate}]: ").strip()
-        if bitrate:
-            try:
-                test_config = AudioConfig(codec=self.config.audio.codec, bitrate=bitrate)
-                self.config.audio.bitrate = bitrate
-            except ValueError as e:
-                print(f"✗ {e}")
-
+        print(f"\n🔊 Audio Encoding Settings\n{_DASH40}")
+        self._prompt_fields(_AUDIO_FIELDS)
         print("✓ Audio settings updated")
 
     def update_subtitle_settings(self) -> None:
         """Update subtitle settings."""
-        print("\n📝 Subtitle Settings")
-        print("-" * 40)
+        print(f"\n📝 Subtitle Settings\n{_DASH40}")
 
-        enabled = input(f"Enable subtitles? (yes/no) [{('yes' if self.config.subtitles.enabled else 'no')}]: ").strip().lower()
-        if enabled in ['yes', 'y']:
-            self.config.subtitles.enabled = True
-        elif enabled in ['no', 'n']:
-            self.config.subtitles.enabled = False
+        self.config.subtitles.enabled = _prompt_bool(
+            f"Enable subtitles? (yes/no) [{('yes' if self.config.subtitles.enabled else 'no')}]: ",
+            self.config.subtitles.enabled,
+        )
 
         language = input(f"Subtitle language code (or blank for default) [{self.config.subtitles.language or ''}]: ").strip()
         self.config.subtitles.language = language if language else None
@@ -225,137 +406,66 @@ class ConfigManager:
 
     def update_processing_options(self) -> None:
         """Update processing options."""
-        print("\n⚙️  Processing Options")
-        print("-" * 40)
-
-        parallel = input(f"Enable parallel processing? (yes/no) [{('yes' if self.config.parallel_processing else 'no')}]: ").strip().lower()
-        if parallel in ['yes', 'y']:
-            self.config.parallel_processing = True
-        elif parallel in ['no', 'n']:
-            self.config.parallel_processing = False
-
-        workers = input(f"Max workers (1-16) [{self.config.max_workers}]: ").strip()
-        if workers:
-            try:
-                workers_val = int(workers)
-                if 1 <= workers_val <= 16:
-                    self.config.max_workers = workers_val
-                else:
-                    print("✗ Max workers must be between 1 and 16. Keeping current value.")
-            except ValueError:
-                print("✗ Invalid value. Keeping current value.")
-
-        skip = input(f"Skip existing files? (yes/no) [{('yes' if self.config.skip_existing else 'no')}]: ").strip().lower()
-        if skip in ['yes', 'y']:
-            self.config.skip_existing = True
-        elif skip in ['no', 'n']:
-            self.config.skip_existing = False
-
-        verbose = input(f"Enable verbose logging? (yes/no) [{('yes' if self.config.verbose else 'no')}]: ").strip().lower()
-        if verbose in ['yes', 'y']:
-            self.config.verbose = True
-        elif verbose in ['no', 'n']:
-            self.config.verbose = False
+        print(f"\n⚙️  Processing Options\n{_DASH40}")
+
+        self.config.parallel_processing = _prompt_bool(
+            f"Enable parallel processing? (yes/no) [{('yes' if self.config.parallel_processing else 'no')}]: ",
+            self.config.parallel_processing,
+        )
+
+        self._prompt_fields((_MAX_WORKERS_FIELD,))
+
+        self.config.skip_existing = _prompt_bool(
+            f"Skip existing files? (yes/no) [{('yes' if self.config.skip_existing else 'no')}]: ",
+            self.config.skip_existing,
+        )
+
+        self.config.verbose = _prompt_bool(
+            f"Enable verbose logging? (yes/no) [{('yes' if self.config.verbose else 'no')}]: ",
+            self.config.verbose,
+        )
 
         print("✓ Processing options updated")
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults."""
-        confirm = input("\n⚠️  Are you sure you want to reset to default configuration? (yes/no): ").strip().lower()
-        if confirm in ['yes', 'y']:
-            self.config = Config()
+        if _prompt_bool("\n⚠️  Are you sure you want to reset to default configuration? (yes/no): ", False):
+            self.config = _default_config().model_copy(deep=True)
             print("✓ Configuration reset to defaults")
         else:
             print("✗ Reset cancelled")
 
     def show_welcome(self) -> None:
         """Display welcome message and configuration guide."""
-        print("\n" + "=" * 70)
-        print(" " * 15 + "🎬 MKV to MP4 Converter")
-        print(" " * 15 + "Configuration Manager")
-        print("=" * 70)
-        print("\n📝 About config.yaml:")
-        print("   The config.yaml file controls how your videos are converted.")
-        print("   You can customize:")
-        print("   • Video quality (resolution, codec, quality level)")
-        print("   • Audio settings (codec, bitrate)")
-        print("   • Subtitle preferences (language, styling)")
-        print("   • Processing options (parallel processing, etc.)")
-        print("\n💡 Tips:")
-        print("   • Lower CRF value = Better quality but larger file size")
-        print("   • Higher resolution = Better quality but slower conversion")
-        print("   • Enable parallel processing if you have a multi-core CPU")
-        print("=" * 70)
+        print(_WELCOME_TEXT)
 
     def show_help(self) -> None:
         """Display detailed help information."""
-        print("\n" + "=" * 70)
-        print("📚 Configuration Help & Tips")
-        print("=" * 70)
-
-        print("\n🎬 VIDEO SETTINGS:")
-        print("   Resolution:")
-        print("     • 480p  - Smaller files, faster encoding (SD quality)")
-        print("     • 720p  - Good balance of quality and file size (HD)")
-        print("     • 1080p - High quality, larger files (Full HD)")
-
-        print("\n   CRF (Constant Rate Factor):")
-        print("     • 18-20 - Very high quality (large files)")
-        print("     • 23-24 - Good quality (recommended)")
-        print("     • 28-30 - Lower quality (smaller files)")
-
-        print("\n   Codec:")
-        print("     • libx264 - H.264 codec, best compatibility")
-        print("     • libx265 - H.265/HEVC, better compression but slower")
-
-        print("\n   Preset:")
-        print("     • fast/faster   - Quick encoding, larger files")
-        print("     • medium        - Balanced (recommended)")
-        print("     • slow/slower   - Better compression, takes longer")
-
-        print("\n🔊 AUDIO SETTINGS:")
-        print("   • AAC (128k-192k) - Best compatibility and quality")
-        print("   • MP3 (128k-320k) - Universal compatibility")
-
-        print("\n📝 SUBTITLE SETTINGS:")
-        print("   • Enabled: Subtitles are burned into the video permanently")
-        print("   • Language: Use 3-letter codes (eng, tha, jpn, chi, etc.)")
-        print("   • Leave blank to use default subtitle track")
-
-        print("\n⚙️  PROCESSING OPTIONS:")
-        print("   • Parallel Processing: Process multiple files at once")
-        print("     WARNING: Uses more CPU and RAM")
-        print("   • Max Workers: How many files to process simultaneously")
-        print("     Recommended: Number of CPU cores - 1")
-        print("   • Skip Existing: Don't re-convert files that already exist")
-
-        print("\n💡 COMMON PRESETS:")
-        print("   Small Files, Fast:  480p, CRF 28, preset fast")
-        print("   Balanced Quality:   480p, CRF 24, preset medium")
-        print("   High Quality:       720p, CRF 20, preset slow")
-        print("   Archive Quality:    1080p, CRF 18, preset slower")
-
-        print("\n📍 FILE LOCATIONS:")
-        print(f"   Config file:   {self.config_path.absolute()}")
-        print(f"   Input folder:  {self.config.input_folder}")
-        print(f"   Output folder: {self.config.output_folder}")
-        print(f"   Logs folder:   {self.config.logs_folder}")
-
-        print("=" * 70)
+        print("\n".join([
+            _HELP_TEXT,
+            "\n📍 FILE LOCATIONS:",
+            f"   Config file:   {self.config_path.absolute()}",
+            f"   Input folder:  {self.config.input_folder}",
+            f"   Output folder: {self.config.output_folder}",
+            f"   Logs folder:   {self.config.logs_folder}",
+            _SEP70,
+        ]))
         input("\n Press Enter to continue...")
 
     def quick_setup_wizard(self) -> None:
         """Run quick setup wizard for first-time users."""
-        print("\n" + "=" * 70)
-        print("🚀 Quick Setup Wizard")
-        print("=" * 70)
-        print("\nLet's configure your video converter with a few simple questions.\n")
+        print(
+            f"\n{_SEP70}\n🚀 Quick Setup Wizard\n{_SEP70}\n"
+            "\nLet's configure your video converter with a few simple questions.\n"
+        )
 
         # Quality preset
-        print("📊 Choose quality preset:")
-        print("  1. High Quality (720p, CRF 20) - Larger files, better quality")
-        print("  2. Balanced (480p, CRF 24) - Recommended for most users")
-        print("  3. Smaller Files (480p, CRF 28) - Faster conversion, smaller files")
+        print(
+            "📊 Choose quality preset:\n"
+            "  1. High Quality (720p, CRF 20) - Larger files, better quality\n"
+            "  2. Balanced (480p, CRF 24) - Recommended for most users\n"
+            "  3. Smaller Files (480p, CRF 28) - Faster conversion, smaller files"
+        )
 
         quality = input("\nSelect preset (1-3) [2]: ").strip() or "2"
 
@@ -374,8 +484,9 @@ class ConfigManager:
 
         # Subtitle settings
         print("\n📝 Subtitle settings:")
-        subtitles = input("Do you want to burn subtitles into the video? (yes/no) [yes]: ").strip().lower() or "yes"
-        self.config.subtitles.enabled = subtitles in ['yes', 'y']
+        self.config.subtitles.enabled = _prompt_bool(
+            "Do you want to burn subtitles into the video? (yes/no) [yes]: ", True
+        )
 
         if self.config.subtitles.enabled:
             lang = input("Preferred subtitle language code (e.g., eng, tha, jpn) [auto]: ").strip()
@@ -389,24 +500,26 @@ class ConfigManager:
 
         # Parallel processing
         print("\n⚙️  Performance settings:")
-        parallel = input("Enable parallel processing for faster conversion? (yes/no) [no]: ").strip().lower() or "no"
-        self.config.parallel_processing = parallel in ['yes', 'y']
+        self.config.parallel_processing = _prompt_bool(
+            "Enable parallel processing for faster conversion? (yes/no) [no]: ", False
+        )
 
         if self.config.parallel_processing:
             workers = input("How many files to process simultaneously? (1-4) [2]: ").strip() or "2"
-            try:
+            if workers.isdecimal():
                 self.config.max_workers = min(4, max(1, int(workers)))
                 print(f"✓ Will process {self.config.max_workers} files in parallel")
-            except ValueError:
+            else:
                 print("✓ Using default: 2 workers")
 
         # Directories
-        print("\n📁 Directory settings:")
-        print("   Input folder:  Where your MKV files are located")
-        print("   Output folder: Where converted MP4 files will be saved")
+        print(
+            "\n📁 Directory settings:\n"
+            "   Input folder:  Where your MKV files are located\n"
+            "   Output folder: Where converted MP4 files will be saved"
+        )
 
-        change_dirs = input("\nUse default folders (input/, output/)? (yes/no) [yes]: ").strip().lower() or "yes"
-        if change_dirs not in ['yes', 'y']:
+        if not _prompt_bool("\nUse default folders (input/, output/)? (yes/no) [yes]: ", True):
             input_dir = input("Input folder path: ").strip()
             if input_dir:
                 self.config.input_folder = Path(input_dir)
@@ -415,16 +528,15 @@ class ConfigManager:
             if output_dir:
                 self.config.output_folder = Path(output_dir)
 
-        print("\n" + "=" * 70)
-        print("✨ Setup complete! Your configuration:")
-        print("=" * 70)
+        print(f"\n{_SEP70}\n✨ Setup complete! Your configuration:\n{_SEP70}")
         self.display_config()
 
-        save = input("\n💾 Save this configuration to config.yaml? (yes/no) [yes]: ").strip().lower() or "yes"
-        if save in ['yes', 'y']:
+        if _prompt_bool("\n💾 Save this configuration to config.yaml? (yes/no) [yes]: ", True):
             self.save_configuration()
-            print("\n✅ Configuration saved! You can now run the converter.")
-            print("   To make changes later, run this script again.")
+            print(
+                "\n✅ Configuration saved! You can now run the converter.\n"
+                "   To make changes later, run this script again."
+            )
         else:
             print("\n⚠️  Configuration not saved. Run setup again to configure.")
 
@@ -435,50 +547,18 @@ class ConfigManager:
         # If first run, offer quick setup
         if self.is_first_run:
             print("\n🎯 It looks like this is your first time setting up.")
-            run_wizard = input("Would you like to run the Quick Setup Wizard? (yes/no) [yes]: ").strip().lower() or "yes"
-            if run_wizard in ['yes', 'y']:
+            if _prompt_bool("Would you like to run the Quick Setup Wizard? (yes/no) [yes]: ", True):
                 self.quick_setup_wizard()
                 return
 
         while True:
-            print("\n📋 Main Menu:")
-            print("  1. View current configuration")
-            print("  2. 🚀 Quick Setup Wizard (Easy configuration)")
-            print("  3. Update directory settings")
-            print("  4. Update video settings")
-            print("  5. Update audio settings")
-            print("  6. Update subtitle settings")
-            print("  7. Update processing options")
-            print("  8. Save configuration")
-            print("  9. Reset to defaults")
-            print("  R. Reload configuration from file")
-            print("  H. Show help and tips")
-            print("  0. Exit")
+            print(_MAIN_MENU)
 
             choice = input("\nSelect option: ").strip().lower()
 
-            if choice == "1":
-                self.display_config()
-            elif choice == "2":
-                self.quick_setup_wizard()
-            elif choice == "3":
-                self.update_directories()
-            elif choice == "4":
-                self.update_video_settings()
-            elif choice == "5":
-                self.update_audio_settings()
-            elif choice == "6":
-                self.update_subtitle_settings()
-            elif choice == "7":
-                self.update_processing_options()
-            elif choice == "8":
-                self.save_configuration()
-            elif choice == "9":
-                self.reset_to_defaults()
-            elif choice == "r":
-                self.load_configuration()
-            elif choice == "h":
-                self.show_help()
+            action = self._actions.get(choice)
+            if action is not None:
+                action()
             elif choice == "0":
                 print("\n👋 Goodbye!")
                 break
@@ -488,6 +568,9 @@ class ConfigManager:
 
 def main() -> None:
     """Main entry point."""
+    _check_python_version()
+    _check_config_modules()
+
     config_path = "config.yaml"
 
     # Check if custom config path provided
@@ -19,39 +19,153 @@ Usage:
     python scripts/process_mkv_files.py --config custom_config.yaml
 """
 
+import os
 import sys
+import time
 import argparse
+from functools import lru_cache
+from concurrent.futures import as_completed
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, Optional
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+_YES = frozenset({"yes", "y", "true", "1"})
+
+_SEP70 = "=" * 70
+
+_WELCOME_BANNER = f"""
+{_SEP70}
+                 🎬 MKV to MP4 Batch Processor
+                   Step 4: Process Each File
+{_SEP70}"""
+
+_FFMPEG_MISSING_TEXT = f"""
+⚠️  WARNING: FFmpeg not found in system PATH!
+   Please install FFmpeg before processing files.
+
+   Installation:
+     macOS:   brew install ffmpeg
+     Ubuntu:  sudo apt install ffmpeg
+     Windows: choco install ffmpeg
+
+{_SEP70}"""
+
+_SETTINGS_TEMPLATE = f"""
+{_SEP70}
+                  ⚙️  CURRENT SETTINGS
+{_SEP70}
+
+📁 Directories:
+   Input:  {{config.input_folder}}
+   Output: {{config.output_folder}}
+   Logs:   {{config.logs_folder}}
+
+🎬 Video Settings:
+   Resolution: {{config.video.resolution}}p
+   Codec:      {{config.video.codec}}
+   Quality:    CRF {{config.video.crf}}
+   Preset:     {{config.video.preset}}
+   Hardware:   {{config.video.hardware_accel}}
+
+🔊 Audio Settings:
+   Codec:   {{config.audio.codec}}
+   Bitrate: {{config.audio.bitrate}}
+
+📝 Subtitle Settings:
+   Enabled:  {{config.subtitles.enabled}}{{language}}
+
+⚙️  Processing Options:
+   Skip existing:      {{config.skip_existing}}
+   Parallel:           {{config.parallel_processing}}{{max_workers}}
+   Verbose logging:    {{config.verbose}}
+
+💡 To change settings, run: python scripts/config_manager.py
+{_SEP70}
+"""
+
+_HELP_TEMPLATE = f"""
+{_SEP70}
+                        📚 HELP & TIPS
+{_SEP70}
+
+🎯 WHAT THIS TOOL DOES:
+   This script processes MKV files and converts them to MP4 format
+   with hard-coded subtitles using FFmpeg. You can:
+   • View all MKV files and their conversion status
+   • Process individual files
+   • Batch process all pending files
+   • View conversion results and statistics
+
+📋 WORKFLOW:
+   1. Place MKV files in the input folder
+   2. Use 'View files' to see what's available
+   3. Choose 'Process all' for batch conversion or
+      'Process single file' to convert one at a time
+   4. Converted MP4 files will be in the output folder
+
+⚙️  SETTINGS:
+   Current settings are loaded from config.yaml
+   To change settings, run: python scripts/config_manager.py
+   Settings include resolution, quality, codecs, etc.
+
+💡 TIPS:
+   • Processing time depends on file size and quality settings
+   • Lower CRF = better quality but larger files
+   • Skip existing files to avoid re-converting
+   • Check logs/ folder for detailed conversion logs
+   • Press Ctrl+C to interrupt long-running conversions
+
+📁 FILE LOCATIONS:
+   Config:  {{config_path}}
+   Input:   {{input_folder}}
+   Output:  {{output_folder}}
+   Logs:    {{logs_folder}}
+{_SEP70}"""
+
+_KB = 1 << 10
+_MB = 1 << 20
+_GB = 1 << 30
+
 # Check Python version and warn about unstable versions
-if sys.version_info >= (3, 14) and "a" in sys.version.lower():
-    print("\n⚠️  WARNING: You are using Python 3.14 alpha version!")
+if sys.version_info >= (3, 14) and sys.version_info.releaselevel != "final":
+    print("\n⚠️  WARNING: You are using a Python 3.14+ pre-release!")
     print("   This may cause crashes with some dependencies.")
     print("   Recommended: Use Python 3.10, 3.11, 3.12, or 3.13 stable release.\n")
     response = input("Continue anyway? (yes/no) [no]: ").strip().lower()
-    if response not in ['yes', 'y']:
+    if response not in _YES:
         print("Exiting. Please use a stable Python version.")
         sys.exit(1)
 
-try:
-    from src.config import load_config, Config
+if TYPE_CHECKING:
+    from src.config import Config
     from src.converter import BatchConverter, ConversionResult
-    from src.utils import validate_ffmpeg, get_video_info, validate_ffprobe
-    from loguru import logger
-except Exception as e:
-    print(f"\n❌ Error loading required modules: {e}")
-    print("\nPossible solutions:")
-    print("  1. Install dependencies: uv sync")
-    print("  2. Use a stable Python version (3.10-3.13)")
-    print("  3. Check if all dependencies are installed correctly")
-    sys.exit(1)
 
 
+def _import_dependencies() -> None:
+    """Import loguru and the converter modules, exiting with help if that fails.
+
+    Deferred until an MKVProcessor is created so that ``--help`` and
+    argument errors return without paying for these imports. The methods
+    import the names they use locally; once loaded here, those imports are
+    only sys.modules lookups.
+    """
+    try:
+        import loguru  # noqa: F401
+        import src.config  # noqa: F401
+        import src.converter  # noqa: F401
+        import src.utils  # noqa: F401
+    except Exception as e:
+        print(f"\n❌ Error loading required modules: {e}")
+        print("\nPossible solutions:")
+        print("  1. Install dependencies: uv sync")
+        print("  2. Use a stable Python version (3.10-3.13)")
+        print("  3. Check if all dependencies are installed correctly")
+        sys.exit(1)
+
+
+@lru_cache(maxsize=4096)
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
 
@@ -65,12 +179,12 @@ def format_file_size(size_bytes: int) -> str:
         >>> format_file_size(1536000000)
         '1.43 GB'
     """
-    if size_bytes >= 1024**3:  # GB
-        return f"{size_bytes / (1024**3):.2f} GB"
-    elif size_bytes >= 1024**2:  # MB
-        return f"{size_bytes / (1024**2):.2f} MB"
-    elif size_bytes >= 1024:  # KB
-        return f"{size_bytes / 1024:.2f} KB"
+    if size_bytes >= _GB:
+        return f"{size_bytes / _GB:.2f} GB"
+    elif size_bytes >= _MB:
+        return f"{size_bytes / _MB:.2f} MB"
+    elif size_bytes >= _KB:
+        return f"{size_bytes / _KB:.2f} KB"
     else:
         return f"{size_bytes} B"
 
@@ -87,19 +201,29 @@ class MKVProcessor:
         converter: BatchConverter instance for file processing
         mkv_files: List of discovered MKV files
         conversion_history: List of completed conversion results
+        stop_after_failures: Consecutive failures that stop a batch (0 = never)
     """
 
-    def __init__(self, config_path: str = "config.yaml") -> None:
+    def __init__(self, config_path: str = "config.yaml", stop_after_failures: int = 0) -> None:
         """Initialize the MKV processor.
 
         Args:
             config_path: Path to the configuration file
+            stop_after_failures: Stop a batch once this many files in a row
+                have failed (0 always finishes the batch)
         """
+        _import_dependencies()
+
         self.config_path: Path = Path(config_path)
+        self.stop_after_failures: int = stop_after_failures
         self.config: Optional[Config] = None
         self.converter: Optional[BatchConverter] = None
         self.mkv_files: list[Path] = []
         self.conversion_history: list[ConversionResult] = []
+        # input file -> (size in bytes, already converted, output path)
+        self._file_cache: dict[Path, tuple[int, bool, Path]] = {}
+        # directory -> st_mtime_ns as seen by the last full scan
+        self._scan_dir_mtimes: dict[Path, int] = {}
 
         # Initialize configuration
         self._load_configuration()
@@ -109,6 +233,10 @@ class MKVProcessor:
 
     def _load_configuration(self) -> None:
         """Load configuration and initialize converter."""
+        from loguru import logger
+        from src.config import Config, load_config
+        from src.converter import BatchConverter
+
         try:
             self.config = load_config(self.config_path)
             logger.info(f"Configuration loaded from {self.config_path}")
@@ -132,6 +260,8 @@ class MKVProcessor:
         Configures console and file logging with appropriate levels
         based on the verbose setting in configuration.
         """
+        from loguru import logger
+
         # Remove default handler
         logger.remove()
 
@@ -173,27 +303,115 @@ class MKVProcessor:
 
         logger.info("Logging initialized for MKV processor")
 
-    def _scan_files(self) -> None:
-        """Scan input folder for MKV files."""
+    def _scan_files(self, force: bool = False) -> None:
+        """Find the MKV files in the input folder and cache their status.
+
+        On a refresh (menu option 7) the directory walk is skipped when
+        neither the input folder nor any folder holding a known MKV file has
+        changed since the last scan, and only file sizes and conversion
+        status are re-read. Adding or removing a file updates its parent
+        folder's mtime, but a file dropped into a nested folder that had no
+        MKV files before is only found by a forced scan (menu option 8) or
+        once the top-level folder changes.
+
+        Args:
+            force: Always walk the input folder
+        """
+        from loguru import logger
+
+        if not force and self.mkv_files and self._scan_dir_mtimes == self._dir_mtimes(
+            self._scan_dir_mtimes
+        ):
+            logger.debug("Input folder unchanged since last scan, refreshing status only")
+            for mkv_file in self.mkv_files:
+                self._update_file_status(mkv_file)
+            return
+
         logger.info(f"Scanning {self.config.input_folder} for MKV files...")
-        self.mkv_files = self.converter.scan_input_folder()
+        entries = self.converter.scan_input_folder_entries()
+        self.mkv_files = [Path(entry.path) for entry in entries]
+
+        self._file_cache = {}
+        for mkv_file, entry in zip(self.mkv_files, entries):
+            self._update_file_status(mkv_file, entry.stat().st_size)
+
+        self._scan_dir_mtimes = self._dir_mtimes(
+            {self.config.input_folder, *(f.parent for f in self.mkv_files)}
+        )
 
         if not self.mkv_files:
             logger.warning("No MKV files found in input directory")
         else:
             logger.info(f"Found {len(self.mkv_files)} MKV file(s)")
 
+    @staticmethod
+    def _dir_mtimes(directories: Iterable[Path]) -> dict[Path, int]:
+        """Return st_mtime_ns for each directory (-1 if it is gone).
+
+        Args:
+            directories: Directories to stat
+
+        Returns:
+            dict[Path, int]: Modification time per directory
+        """
+        mtimes: dict[Path, int] = {}
+        for directory in directories:
+            try:
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtimes[directory] = -1
+        return mtimes
+
+    def _update_file_status(
+        self, input_file: Path, size_bytes: Optional[int] = None
+    ) -> tuple[int, bool, Path]:
+        """Stat a file and its expected output, and cache the result.
+
+        The output path is reused from a previous entry when there is one, so
+        re-checking after a conversion does not rebuild it.
+
+        Args:
+            input_file: Path to the input MKV file
+            size_bytes: Input size if already known (e.g. from a scandir entry)
+
+        Returns:
+            tuple[int, bool, Path]: Input size, whether the output exists, output path
+        """
+        if size_bytes is None:
+            size_bytes = os.stat(input_file).st_size
+        previous = self._file_cache.get(input_file)
+        output_file: Path = (
+            previous[2] if previous is not None
+            else self.converter._generate_output_path(input_file)
+        )
+        entry = (size_bytes, os.path.lexists(output_file), output_file)
+        self._file_cache[input_file] = entry
+        return entry
+
+    def _file_status(self, input_file: Path) -> tuple[int, bool, Path]:
+        """Return the cached scan entry for a file, computing it if missing.
+
+        Args:
+            input_file: Path to the input MKV file
+
+        Returns:
+            tuple[int, bool, Path]: Input size, whether the output exists, output path
+        """
+        entry = self._file_cache.get(input_file)
+        return entry if entry is not None else self._update_file_status(input_file)
+
     def _check_already_converted(self, input_file: Path) -> bool:
         """Check if a file has already been converted.
 
+        Uses the status cached by the last scan or conversion.
+
         Args:
             input_file: Path to the input MKV file
 
         Returns:
             bool: True if output file exists
         """
-        output_file: Path = self.converter._generate_output_path(input_file)
-        return output_file.exists()
+        return self._file_status(input_file)[1]
 
     def _display_file_list(self, show_details: bool = False) -> None:
         """Display list of MKV files with status.
@@ -201,85 +419,102 @@ class MKVProcessor:
         Args:
             show_details: Whether to show detailed video information
         """
+        from src.utils import get_video_infos, validate_ffprobe
+
         if not self.mkv_files:
             print("\n⚠️  No MKV files found.")
             print(f"   Place your MKV files in: {self.config.input_folder}")
             return
 
-        # Calculate statistics
+        # Calculate statistics in a single pass, keeping rows for the list below
         total_files: int = len(self.mkv_files)
-        total_size: int = sum(f.stat().st_size for f in self.mkv_files)
-        already_converted: int = sum(
-            1 for f in self.mkv_files if self._check_already_converted(f)
-        )
+        total_size: int = 0
+        already_converted: int = 0
+        rows: list[tuple[Path, int, bool]] = []
+        for mkv_file in self.mkv_files:
+            size_bytes, converted, _ = self._file_status(mkv_file)
+            total_size += size_bytes
+            already_converted += converted
+            rows.append((mkv_file, size_bytes, converted))
         pending: int = total_files - already_converted
 
-        print("\n" + "="*70)
-        print("                    📋 MKV FILES OVERVIEW")
-        print("="*70)
-        print(f"\n📊 Summary:")
-        print(f"   Total files:       {total_files}")
-        print(f"   Already converted: {already_converted}")
-        print(f"   Pending:           {pending}")
-        print(f"   Total size:        {format_file_size(total_size)}")
-        print(f"\n📁 Input folder:  {self.config.input_folder}")
-        print(f"📁 Output folder: {self.config.output_folder}")
-        print(f"🎬 Target:        {self.config.video.resolution}p MP4")
-
-        print("\n" + "="*70)
-        print("                    📄 FILE LIST")
-        print("="*70)
+        lines: list[str] = []
+        lines.append("\n" + "="*70)
+        lines.append("                    📋 MKV FILES OVERVIEW")
+        lines.append("="*70)
+        lines.append(f"\n📊 Summary:")
+        lines.append(f"   Total files:       {total_files}")
+        lines.append(f"   Already converted: {already_converted}")
+        lines.append(f"   Pending:           {pending}")
+        lines.append(f"   Total size:        {format_file_size(total_size)}")
+        lines.append(f"\n📁 Input folder:  {self.config.input_folder}")
+        lines.append(f"📁 Output folder: {self.config.output_folder}")
+        lines.append(f"🎬 Target:        {self.config.video.resolution}p MP4")
+
+        lines.append("\n" + "="*70)
+        lines.append("                    📄 FILE LIST")
+        lines.append("="*70)
+
+        video_infos: dict[Path, dict[str, str]] = (
+            get_video_infos(self.mkv_files)
+            if show_details and validate_ffprobe()
+            else {}
+        )
 
-        for idx, mkv_file in enumerate(self.mkv_files, 1):
-            size_bytes: int = mkv_file.stat().st_size
+        for idx, (mkv_file, size_bytes, converted) in enumerate(rows, 1):
             size_str: str = format_file_size(size_bytes)
-            already_converted: bool = self._check_already_converted(mkv_file)
-            status: str = "✅ Converted" if already_converted else "⏳ Pending"
+            status: str = "✅ Converted" if converted else "⏳ Pending"
 
-            print(f"\n  [{idx}] {mkv_file.name}")
-            print(f"      Path:   {mkv_file}")
-            print(f"      Size:   {size_str}")
-            print(f"      Status: {status}")
+            lines.append(f"\n  [{idx}] {mkv_file.name}")
+            lines.append(f"      Path:   {mkv_file}")
+            lines.append(f"      Size:   {size_str}")
+            lines.append(f"      Status: {status}")
 
             # Show detailed info if requested
-            if show_details and validate_ffprobe():
-                video_info = get_video_info(mkv_file)
+            if show_details:
+                video_info = video_infos.get(mkv_file)
                 if video_info:
-                    print(f"      Video Details:")
+                    lines.append(f"      Video Details:")
                     if "codec_name" in video_info:
-                        print(f"        - Codec: {video_info['codec_name']}")
+                        lines.append(f"        - Codec: {video_info['codec_name']}")
                     if "width" in video_info and "height" in video_info:
-                        print(f"        - Resolution: {video_info['width']}x{video_info['height']}")
+                        lines.append(f"        - Resolution: {video_info['width']}x{video_info['height']}")
                     if "duration" in video_info:
                         try:
                             duration_sec = float(video_info['duration'])
                             duration_min = int(duration_sec // 60)
                             duration_sec_remainder = int(duration_sec % 60)
-                            print(f"        - Duration: {duration_min}m {duration_sec_remainder}s")
+                            lines.append(f"        - Duration: {duration_min}m {duration_sec_remainder}s")
                         except (ValueError, TypeError):
                             # Duration is not a valid number (e.g., 'N/A')
-                            print(f"        - Duration: {video_info['duration']}")
+                            lines.append(f"        - Duration: {video_info['duration']}")
 
-        print("\n" + "="*70 + "\n")
+        lines.append("\n" + "="*70 + "\n")
+        self._render(lines)
 
     def _process_single_file(self) -> None:
         """Process a single selected MKV file."""
+        from loguru import logger
+
         if not self.mkv_files:
             print("\n⚠️  No MKV files available to process.")
             return
 
-        # Display file list
+        # Display file list, keeping each file's status for the selection below
+        converted: list[bool] = [self._check_already_converted(f) for f in self.mkv_files]
         print("\n📋 Select a file to process:\n")
-        for idx, mkv_file in enumerate(self.mkv_files, 1):
-            already_converted: bool = self._check_already_converted(mkv_file)
-            status: str = "✅" if already_converted else "⏳"
-            print(f"  [{idx}] {status} {mkv_file.name}")
-
+        print("\n".join(
+            f"  [{idx}] {'✅' if is_converted else '⏳'} {mkv_file.name}"
+            for idx, (mkv_file, is_converted) in enumerate(zip(self.mkv_files, converted), 1)
+        ))
         print(f"  [0] Cancel")
 
         # Get user selection
         try:
             choice: str = input("\nEnter file number: ").strip()
+            if not choice.isdecimal():
+                print("❌ Invalid input. Please enter a number.")
+                return
             file_idx: int = int(choice)
 
             if file_idx == 0:
@@ -293,10 +528,10 @@ class MKVProcessor:
             selected_file: Path = self.mkv_files[file_idx - 1]
 
             # Check if already converted
-            if self.config.skip_existing and self._check_already_converted(selected_file):
+            if self.config.skip_existing and converted[file_idx - 1]:
                 print(f"\n⚠️  File already converted: {selected_file.name}")
                 overwrite: str = input("   Re-convert anyway? (yes/no) [no]: ").strip().lower()
-                if overwrite not in ['yes', 'y']:
+                if overwrite not in _YES:
                     print("❌ Skipped")
                     return
 
@@ -304,14 +539,15 @@ class MKVProcessor:
             print(f"\n🎬 Processing: {selected_file.name}")
             print("="*70)
 
-            result: ConversionResult = self.converter.process_file(selected_file)
+            result: ConversionResult = self.converter.process_file(
+                selected_file, size_bytes=self._file_status(selected_file)[0]
+            )
             self.conversion_history.append(result)
+            self._update_file_status(selected_file)
 
             # Display result
             self._display_conversion_result(result)
 
-        except ValueError:
-            print("❌ Invalid input. Please enter a number.")
         except KeyboardInterrupt:
             print("\n\n⚠️  Processing interrupted by user")
         except Exception as e:
@@ -347,7 +583,7 @@ class MKVProcessor:
             print(f"   Subtitles: Disabled")
 
         confirm: str = input(f"\nProceed with batch conversion? (yes/no) [yes]: ").strip().lower()
-        if confirm not in ['', 'yes', 'y']:
+        if (confirm or "yes") not in _YES:
             print("❌ Cancelled")
             return
 
@@ -356,7 +592,34 @@ class MKVProcessor:
         print("               🚀 BATCH CONVERSION STARTED")
         print("="*70)
 
-        start_time: datetime = datetime.now()
+        start_time: float = time.perf_counter()
+
+        if self.config.parallel_processing and len(pending_files) > 1:
+            results: list[ConversionResult] = self._process_files_parallel(pending_files, start_time)
+        else:
+            results = self._process_files_serial(pending_files, start_time)
+
+        # Display summary
+        total_time: float = time.perf_counter() - start_time
+        print("\n" + "="*70)
+        self.converter.generate_summary(results)
+        print(f"⏱️  Batch processing completed in {self._format_duration(total_time)}")
+        print("="*70 + "\n")
+
+    def _process_files_serial(
+        self, pending_files: list[Path], start_time: float
+    ) -> list["ConversionResult"]:
+        """Convert files one after another.
+
+        Args:
+            pending_files: Files to convert, in processing order
+            start_time: time.perf_counter() value at batch start, for the ETA
+
+        Returns:
+            list[ConversionResult]: Results for the files that were processed
+        """
+        from loguru import logger
+
         results: list[ConversionResult] = []
 
         for idx, mkv_file in enumerate(pending_files, 1):
@@ -364,16 +627,13 @@ class MKVProcessor:
             print("-"*70)
 
             try:
-                result: ConversionResult = self.converter.process_file(mkv_file)
-                results.append(result)
-                self.conversion_history.append(result)
-
-                if result.success:
-                    print(f"✅ Success: {mkv_file.name}")
-                else:
-                    print(f"❌ Failed: {mkv_file.name}")
-                    if result.error_message:
-                        print(f"   Error: {result.error_message[:100]}")
+                result: ConversionResult = self.converter.process_file(
+                    mkv_file, size_bytes=self._file_status(mkv_file)[0]
+                )
+                if self._record_batch_result(
+                    mkv_file, result, results, len(pending_files), start_time
+                ):
+                    break
 
             except KeyboardInterrupt:
                 print("\n\n⚠️  Batch processing interrupted by user")
@@ -383,14 +643,121 @@ class MKVProcessor:
                 logger.exception(f"Unexpected error processing {mkv_file.name}: {e}")
                 print(f"❌ Unexpected error: {e}")
 
-        # Display summary
-        total_time: float = (datetime.now() - start_time).total_seconds()
-        print("\n" + "="*70)
-        self.converter.generate_summary(results)
-        print(f"⏱️  Batch processing completed in {self._format_duration(total_time)}")
-        print("="*70 + "\n")
+        return results
+
+    def _process_files_parallel(
+        self, pending_files: list[Path], start_time: float
+    ) -> list["ConversionResult"]:
+        """Convert files concurrently on the converter's worker pool.
+
+        Each FFmpeg instance gets an equal share of the CPU cores so that
+        ``max_workers`` encoders running side by side don't oversubscribe
+        the machine. Files are submitted largest first, so the long encodes
+        start early and the short ones fill in the tail of the batch.
+
+        Args:
+            pending_files: Files to convert
+            start_time: time.perf_counter() value at batch start, for the ETA
+
+        Returns:
+            list[ConversionResult]: Results in completion order
+        """
+        from loguru import logger
+
+        total: int = len(pending_files)
+        workers, threads = self.converter.plan_workers(total)
+        results: list[ConversionResult] = []
+        by_size: list[Path] = sorted(
+            pending_files, key=lambda f: self._file_status(f)[0], reverse=True
+        )
+
+        print(f"\n⚡ Running {workers} conversion(s) in parallel ({threads} FFmpeg thread(s) each)")
+
+        with self.converter.conversion_pool(workers) as executor:
+            futures = {
+                executor.submit(
+                    self.converter.process_file, mkv_file, threads, self._file_status(mkv_file)[0]
+                ): mkv_file
+                for mkv_file in by_size
+            }
+            completed: int = 0
+
+            try:
+                for future in as_completed(futures):
+                    mkv_file: Path = futures[future]
+                    completed += 1
+                    print(f"\n[{completed}/{total}] Finished: {mkv_file.name}")
+                    print("-"*70)
+
+                    try:
+                        result: ConversionResult = future.result()
+                    except Exception as e:
+                        logger.exception(f"Unexpected error processing {mkv_file.name}: {e}")
+                        print(f"❌ Unexpected error: {e}")
+                        continue
+
+                    if self._record_batch_result(mkv_file, result, results, total, start_time):
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                print("\n\n⚠️  Batch processing interrupted by user")
+                print(f"   Processed {completed} of {total} files")
+
+        return results
 
-    def _display_conversion_result(self, result: ConversionResult) -> None:
+    def _record_batch_result(
+        self,
+        mkv_file: Path,
+        result: "ConversionResult",
+        results: list["ConversionResult"],
+        total: int,
+        start_time: float,
+    ) -> bool:
+        """Record a finished file of a batch run and print its outcome.
+
+        Args:
+            mkv_file: The converted input file
+            result: ConversionResult for that file
+            results: Results of the current batch so far (appended to)
+            total: Number of files in the batch
+            start_time: time.perf_counter() value at batch start
+
+        Returns:
+            bool: True if the batch should stop because stop_after_failures
+            files in a row have failed
+        """
+        results.append(result)
+        self.conversion_history.append(result)
+        self._update_file_status(mkv_file)
+
+        if result.success:
+            print(f"✅ Success: {mkv_file.name}")
+        else:
+            print(f"❌ Failed: {mkv_file.name}")
+            if result.error_message:
+                print(f"   Error: {result.error_message[:100]}")
+
+        done: int = len(results)
+        succeeded: int = sum(1 for r in results if r.success)
+        progress: str = f"   Progress: {done}/{total} done, {succeeded} succeeded, {done - succeeded} failed"
+        if done < total:
+            elapsed: float = time.perf_counter() - start_time
+            progress += f" | ETA: {self._format_duration(elapsed * (total - done) / done)}"
+        print(progress)
+
+        limit: int = self.stop_after_failures
+        if limit <= 0:
+            return False
+        recent = results[-limit:]
+        if len(recent) == limit and not any(r.success for r in recent):
+            print(f"\n⚠️  {limit} files failed in a row, stopping batch")
+            print("   Check logs/ folder for FFmpeg errors")
+            return True
+        return False
+
+    def _display_conversion_result(self, result: "ConversionResult") -> None:
         """Display detailed conversion result.
 
         Args:
@@ -428,86 +795,56 @@ class MKVProcessor:
             print("\n⚠️  No conversions performed in this session yet.")
             return
 
-        print("\n" + "="*70)
-        print("              📜 CONVERSION HISTORY (Current Session)")
-        print("="*70)
+        lines: list[str] = []
+        lines.append("\n" + "="*70)
+        lines.append("              📜 CONVERSION HISTORY (Current Session)")
+        lines.append("="*70)
 
         total_files: int = len(self.conversion_history)
         successful: int = sum(1 for r in self.conversion_history if r.success)
         failed: int = total_files - successful
 
-        print(f"\n📊 Session Summary:")
-        print(f"   Total conversions: {total_files}")
-        print(f"   ✅ Successful:     {successful}")
-        print(f"   ❌ Failed:         {failed}")
+        lines.append(f"\n📊 Session Summary:")
+        lines.append(f"   Total conversions: {total_files}")
+        lines.append(f"   ✅ Successful:     {successful}")
+        lines.append(f"   ❌ Failed:         {failed}")
 
-        print("\n📋 Conversion Log:")
-        print("="*70)
+        lines.append("\n📋 Conversion Log:")
+        lines.append("="*70)
 
         for idx, result in enumerate(self.conversion_history, 1):
             status: str = "✅" if result.success else "❌"
-            print(f"\n  [{idx}] {status} {result.input_file.name}")
+            lines.append(f"\n  [{idx}] {status} {result.input_file.name}")
 
             if result.success:
-                print(f"      {result.original_size_mb:.1f}MB → {result.converted_size_mb:.1f}MB")
-                print(f"      Duration: {self._format_duration(result.duration_seconds)}")
+                lines.append(f"      {result.original_size_mb:.1f}MB → {result.converted_size_mb:.1f}MB")
+                lines.append(f"      Duration: {self._format_duration(result.duration_seconds)}")
             else:
-                print(f"      Error: {result.error_message[:80] if result.error_message else 'Unknown error'}")
+                lines.append(f"      Error: {result.error_message[:80] if result.error_message else 'Unknown error'}")
 
-        print("\n" + "="*70 + "\n")
+        lines.append("\n" + "="*70 + "\n")
+        self._render(lines)
 
     def _view_current_settings(self) -> None:
         """Display current processing settings."""
-        print("\n" + "="*70)
-        print("                  ⚙️  CURRENT SETTINGS")
-        print("="*70)
-
-        print(f"\n📁 Directories:")
-        print(f"   Input:  {self.config.input_folder}")
-        print(f"   Output: {self.config.output_folder}")
-        print(f"   Logs:   {self.config.logs_folder}")
-
-        print(f"\n🎬 Video Settings:")
-        print(f"   Resolution: {self.config.video.resolution}p")
-        print(f"   Codec:      {self.config.video.codec}")
-        print(f"   Quality:    CRF {self.config.video.crf}")
-        print(f"   Preset:     {self.config.video.preset}")
-
-        print(f"\n🔊 Audio Settings:")
-        print(f"   Codec:   {self.config.audio.codec}")
-        print(f"   Bitrate: {self.config.audio.bitrate}")
-
-        print(f"\n📝 Subtitle Settings:")
-        print(f"   Enabled:  {self.config.subtitles.enabled}")
-        if self.config.subtitles.language:
-            print(f"   Language: {self.config.subtitles.language}")
-
-        print(f"\n⚙️  Processing Options:")
-        print(f"   Skip existing:      {self.config.skip_existing}")
-        print(f"   Parallel:           {self.config.parallel_processing}")
-        if self.config.parallel_processing:
-            print(f"   Max workers:        {self.config.max_workers}")
-        print(f"   Verbose logging:    {self.config.verbose}")
-
-        print("\n💡 To change settings, run: python scripts/config_manager.py")
-        print("="*70 + "\n")
+        config = self.config
+        language: str = (
+            f"\n   Language: {config.subtitles.language}" if config.subtitles.language else ""
+        )
+        max_workers: str = (
+            f"\n   Max workers:        {config.max_workers}" if config.parallel_processing else ""
+        )
+        print(_SETTINGS_TEMPLATE.format(config=config, language=language, max_workers=max_workers))
 
     def _show_welcome(self) -> None:
         """Display welcome message and system information."""
-        print("\n" + "="*70)
-        print("                 🎬 MKV to MP4 Batch Processor")
-        print("                   Step 4: Process Each File")
-        print("="*70)
+        from src.utils import validate_ffmpeg
+
+        print(_WELCOME_BANNER)
 
         # Check FFmpeg
         if not validate_ffmpeg():
-            print("\n⚠️  WARNING: FFmpeg not found in system PATH!")
-            print("   Please install FFmpeg before processing files.")
-            print("\n   Installation:")
-            print("     macOS:   brew install ffmpeg")
-            print("     Ubuntu:  sudo apt install ffmpeg")
-            print("     Windows: choco install ffmpeg")
-            print("\n" + "="*70)
+            print(_FFMPEG_MISSING_TEXT)
             return
 
         print("\n✅ FFmpeg is installed and ready")
@@ -529,45 +866,23 @@ class MKVProcessor:
 
     def _show_help(self) -> None:
         """Display help information."""
-        print("\n" + "="*70)
-        print("                        📚 HELP & TIPS")
-        print("="*70)
+        print(_HELP_TEMPLATE.format(
+            config_path=self.config_path.absolute(),
+            input_folder=self.config.input_folder.absolute(),
+            output_folder=self.config.output_folder.absolute(),
+            logs_folder=self.config.logs_folder.absolute(),
+        ))
+        input("\nPress Enter to continue...")
 
-        print("\n🎯 WHAT THIS TOOL DOES:")
-        print("   This script processes MKV files and converts them to MP4 format")
-        print("   with hard-coded subtitles using FFmpeg. You can:")
-        print("   • View all MKV files and their conversion status")
-        print("   • Process individual files")
-        print("   • Batch process all pending files")
-        print("   • View conversion results and statistics")
-
-        print("\n📋 WORKFLOW:")
-        print("   1. Place MKV files in the input folder")
-        print("   2. Use 'View files' to see what's available")
-        print("   3. Choose 'Process all' for batch conversion or")
-        print("      'Process single file' to convert one at a time")
-        print("   4. Converted MP4 files will be in the output folder")
-
-        print("\n⚙️  SETTINGS:")
-        print("   Current settings are loaded from config.yaml")
-        print("   To change settings, run: python scripts/config_manager.py")
-        print("   Settings include resolution, quality, codecs, etc.")
-
-        print("\n💡 TIPS:")
-        print("   • Processing time depends on file size and quality settings")
-        print("   • Lower CRF = better quality but larger files")
-        print("   • Skip existing files to avoid re-converting")
-        print("   • Check logs/ folder for detailed conversion logs")
-        print("   • Press Ctrl+C to interrupt long-running conversions")
-
-        print("\n📁 FILE LOCATIONS:")
-        print(f"   Config:  {self.config_path.absolute()}")
-        print(f"   Input:   {self.config.input_folder.absolute()}")
-        print(f"   Output:  {self.config.output_folder.absolute()}")
-        print(f"   Logs:    {self.config.logs_folder.absolute()}")
+    @staticmethod
+    def _render(lines: list[str]) -> None:
+        """Write a whole screen to stdout in a single call.
 
-        print("="*70)
-        input("\nPress Enter to continue...")
+        Args:
+            lines: Screen lines, joined with newlines like consecutive print() calls
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
@@ -583,18 +898,18 @@ class MKVProcessor:
             >>> MKVProcessor._format_duration(3725)
             '1h 2m 5s'
         """
-        mins, secs = divmod(int(seconds), 60)
-        hours, mins = divmod(mins, 60)
+        total = int(seconds)
+        hours, rem = total // 3600, total % 3600
+        mins, secs = rem // 60, rem % 60
 
         if hours > 0:
             return f"{hours}h {mins}m {secs}s"
-        elif mins > 0:
-            return f"{mins}m {secs}s"
-        else:
-            return f"{secs}s"
+        return f"{mins}m {secs}s" if mins > 0 else f"{secs}s"
 
     def run(self) -> None:
         """Run the interactive MKV processor."""
+        from src.utils import validate_ffprobe
+
         self._show_welcome()
 
         while True:
@@ -606,6 +921,7 @@ class MKVProcessor:
             print("  5. View conversion history (current session)")
             print("  6. View current settings")
             print("  7. Refresh file list")
+            print("  8. Rescan input folder (full)")
             print("  H. Show help")
             print("  0. Exit")
 
@@ -630,6 +946,10 @@ class MKVProcessor:
                 print("\n🔄 Refreshing file list...")
                 self._scan_files()
                 print(f"✓ Found {len(self.mkv_files)} MKV file(s)")
+            elif choice == "8":
+                print("\n🔄 Rescanning input folder...")
+                self._scan_files(force=True)
+                print(f"✓ Found {len(self.mkv_files)} MKV file(s)")
             elif choice == "h":
                 self._show_help()
             elif choice == "0":
@@ -657,6 +977,9 @@ Examples:
 
   # Run with custom config
   python scripts/process_mkv_files.py --config my_config.yaml
+
+  # Stop a batch after 3 failures in a row
+  python scripts/process_mkv_files.py --stop-after-failures 3
         """
     )
     parser.add_argument(
@@ -665,11 +988,20 @@ Examples:
         default="config.yaml",
         help="Path to configuration file (default: config.yaml)"
     )
+    parser.add_argument(
+        "--stop-after-failures",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Stop a batch after N files in a row fail (default: 0, never stop)"
+    )
     args = parser.parse_args()
 
     try:
         # Create and run processor
-        processor = MKVProcessor(config_path=args.config)
+        processor = MKVProcessor(
+            config_path=args.config, stop_after_failures=args.stop_after_failures
+        )
         processor.run()
         return 0
 
@@ -677,6 +1009,8 @@ Examples:
         print("\n\n⚠️  Interrupted by user")
         return 130
     except Exception as e:
+        from loguru import logger
+
         logger.exception(f"Fatal error: {e}")
         print(f"\n❌ Fatal error: {e}")
         print("   Check logs for details")
@@ -14,18 +14,24 @@ Usage:
     python scripts/scan_mkv_files.py --config custom_config.yaml
 """
 
+import os
 import sys
 import argparse
 from pathlib import Path
+from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import load_config, Config
 from src.converter import BatchConverter
-from src.utils import get_video_info, validate_ffprobe
+from src.utils import get_video_infos, validate_ffprobe
 from loguru import logger
 
+# Size units and their byte scales, indexed by power of 1024
+_UNITS = ("B", "KB", "MB", "GB")
+_SCALES = tuple(1 << (10 * i) for i in range(len(_UNITS)))
+
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
@@ -36,66 +42,66 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         str: Formatted file size (e.g., "1.2 GB", "450 MB")
     """
-    if size_bytes >= 1024**3:  # GB
-        return f"{size_bytes / (1024**3):.2f} GB"
-    elif size_bytes >= 1024**2:  # MB
-        return f"{size_bytes / (1024**2):.2f} MB"
-    elif size_bytes >= 1024:  # KB
-        return f"{size_bytes / 1024:.2f} KB"
-    else:
+    # Each unit is 10 bits wide, so the bit length picks the unit directly
+    unit = min((size_bytes.bit_length() - 1) // 10, len(_UNITS) - 1)
+    if unit <= 0:
         return f"{size_bytes} B"
+    return f"{size_bytes / _SCALES[unit]:.2f} {_UNITS[unit]}"
 
 
-def check_already_converted(input_file: Path, converter: BatchConverter) -> bool:
-    """Check if a file has already been converted.
+def list_output_folder(folder: str) -> frozenset[str]:
+    """List the names in an output folder.
 
     Args:
-        input_file: Path to the input MKV file
-        converter: BatchConverter instance
+        folder: Output folder to list
 
     Returns:
-        bool: True if output file exists
+        frozenset[str]: Names in the folder (empty if it does not exist)
     """
-    output_file = converter._generate_output_path(input_file)
-    return output_file.exists()
+    try:
+        return frozenset(os.listdir(folder))
+    except FileNotFoundError:
+        return frozenset()
 
 
-def display_file_info(mkv_file: Path, converter: BatchConverter, show_details: bool = False) -> None:
-    """Display information about a single MKV file.
+def format_file_info(
+    entry: os.DirEntry, already_converted: bool, video_info: Optional[dict[str, str]] = None
+) -> list[str]:
+    """Format the display lines for a single MKV file.
 
     Args:
-        mkv_file: Path to the MKV file
-        converter: BatchConverter instance
-        show_details: Whether to show detailed video information
-    """
-    # Get file size
-    size_bytes = mkv_file.stat().st_size
-    size_str = format_file_size(size_bytes)
+        entry: Directory entry of the MKV file from the scan (its stat is cached)
+        already_converted: Whether the output file already exists
+        video_info: ffprobe details to show, if they were requested
 
-    # Check if already converted
-    already_converted = check_already_converted(mkv_file, converter)
+    Returns:
+        list[str]: Output lines for the file, without trailing newlines
+    """
+    size_str = format_file_size(entry.stat().st_size)
     status = "✅ Converted" if already_converted else "⏳ Pending"
 
-    # Display basic info
-    print(f"\n  📄 {mkv_file.name}")
-    print(f"     Path: {mkv_file}")
-    print(f"     Size: {size_str}")
-    print(f"     Status: {status}")
-
-    # Display detailed video info if requested
-    if show_details and validate_ffprobe():
-        video_info = get_video_info(mkv_file)
-        if video_info:
-            print(f"     Video Details:")
-            if "codec_name" in video_info:
-                print(f"       - Codec: {video_info['codec_name']}")
-            if "width" in video_info and "height" in video_info:
-                print(f"       - Resolution: {video_info['width']}x{video_info['height']}")
-            if "duration" in video_info:
-                duration_sec = float(video_info['duration'])
-                duration_min = int(duration_sec // 60)
-                duration_sec_remainder = int(duration_sec % 60)
-                print(f"       - Duration: {duration_min}m {duration_sec_remainder}s")
+    # Basic info
+    lines = [
+        f"\n  📄 {entry.name}",
+        f"     Path: {entry.path}",
+        f"     Size: {size_str}",
+        f"     Status: {status}",
+    ]
+
+    # Detailed video info if requested
+    if video_info:
+        lines.append("     Video Details:")
+        if "codec_name" in video_info:
+            lines.append(f"       - Codec: {video_info['codec_name']}")
+        if "width" in video_info and "height" in video_info:
+            lines.append(f"       - Resolution: {video_info['width']}x{video_info['height']}")
+        if "duration" in video_info:
+            duration_sec = float(video_info['duration'])
+            duration_min = int(duration_sec // 60)
+            duration_sec_remainder = int(duration_sec % 60)
+            lines.append(f"       - Duration: {duration_min}m {duration_sec_remainder}s")
+
+    return lines
 
 
 def main() -> int:
@@ -148,17 +154,37 @@ def main() -> int:
 
     # Scan for MKV files
     print(f"\n🔍 Scanning for MKV files...")
-    mkv_files = converter.scan_input_folder()
+    entries = converter.scan_input_folder_entries()
 
-    if not mkv_files:
+    if not entries:
         print("\n⚠️  No MKV files found in the input directory.")
         print(f"\n💡 Place your MKV files in: {config.input_folder}")
         return 0
 
+    # Collect sizes and expected output names, grouped by output folder
+    expected_outputs: dict[str, set[str]] = {}
+    outputs: list[tuple[str, str]] = []
+    total_size = 0
+    for entry in entries:
+        output_folder = converter._output_dir_for(os.path.dirname(entry.path))
+        output_name = converter._output_basename(entry.name)
+        expected_outputs.setdefault(output_folder, set()).add(output_name)
+        outputs.append((output_folder, output_name))
+        total_size += entry.stat().st_size
+
+    # Intersect each output folder listing with the names expected in it
+    converted_outputs = {
+        folder: names & list_output_folder(folder)
+        for folder, names in expected_outputs.items()
+    }
+    already_converted = sum(map(len, converted_outputs.values()))
+    file_infos: list[tuple[os.DirEntry, bool]] = [
+        (entry, name in converted_outputs[folder])
+        for entry, (folder, name) in zip(entries, outputs)
+    ]
+
     # Display summary
-    total_files = len(mkv_files)
-    total_size = sum(f.stat().st_size for f in mkv_files)
-    already_converted = sum(1 for f in mkv_files if check_already_converted(f, converter))
+    total_files = len(file_infos)
     pending = total_files - already_converted
 
     print(f"\n📊 Summary:")
@@ -167,21 +193,23 @@ def main() -> int:
     print(f"   Pending conversion: {pending}")
     print(f"   Total size: {format_file_size(total_size)}")
 
-    # Display individual file information
-    print(f"\n📋 File List:")
-    print("="*60)
+    video_infos: dict[str, dict[str, str]] = {}
+    if args.details and validate_ffprobe():
+        video_infos = get_video_infos([entry.path for entry in entries])
 
-    for mkv_file in mkv_files:
-        display_file_info(mkv_file, converter, show_details=args.details)
+    # Build the file list and footer, then write them in one call
+    lines = ["\n📋 File List:", "="*60]
+    for entry, converted in file_infos:
+        lines.extend(format_file_info(entry, converted, video_infos.get(entry.path)))
 
-    # Display footer
-    print("\n" + "="*60)
+    lines.append("\n" + "="*60)
     if pending > 0:
-        print(f"✨ {pending} file(s) ready for conversion")
-        print(f"   Run 'python main.py' to start converting")
+        lines.append(f"✨ {pending} file(s) ready for conversion")
+        lines.append(f"   Run 'python main.py' to start converting")
     else:
-        print("✅ All files have been converted!")
-    print("="*60 + "\n")
+        lines.append("✅ All files have been converted!")
+    lines.append("="*60 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
@@ -20,97 +20,172 @@ Usage:
     python scripts/validate_ffmpeg.py --install
 """
 
+import os
+import re
 import sys
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils import validate_ffmpeg, get_ffmpeg_version, validate_ffprobe
+from src.utils import clear_probe_caches as utils_clear_probe_caches
 from loguru import logger
 import subprocess
 
+try:
+    import distro
+except ImportError:  # optional, only used for Linux distribution names
+    distro = None
+
+_YES = frozenset({"yes", "y", "true", "1"})
+
+# Package managers in order of preference
+_PACKAGE_MANAGERS = ('brew', 'apt', 'apt-get', 'yum', 'dnf', 'pacman', 'choco')
+
+# Required encoders, matched as whole words in ``ffmpeg -encoders`` output
+_REQUIRED_CODECS = ("libx264", "libx265", "aac")
+_CODEC_RE = re.compile(rb"\b(libx264|libx265|aac)\b", re.IGNORECASE)
+
+_LINUX_COMMON = {
+    'snap': "sudo snap install ffmpeg",
+    'manual': "Download from: https://ffmpeg.org/download.html#build-linux",
+}
+_WINDOWS_COMMON = {
+    'scoop': "scoop install ffmpeg",
+    'winget': "winget install ffmpeg",
+    'manual': "Download from: https://ffmpeg.org/download.html#build-windows",
+}
+_LINUX_APT = MappingProxyType({'apt': "sudo apt update && sudo apt install ffmpeg", **_LINUX_COMMON})
+
+# Installation instructions keyed by (os_type, package_manager); a None package
+# manager is the fallback for its OS and (None, None) the fallback for any OS
+_INSTRUCTIONS: Mapping[Tuple[Optional[str], Optional[str]], Mapping[str, str]] = MappingProxyType({
+    ('darwin', None): MappingProxyType({
+        'homebrew': "brew install ffmpeg",
+        'macports': "sudo port install ffmpeg",
+        'manual': "Download from: https://evermeet.cx/ffmpeg/",
+    }),
+    ('linux', 'apt'): _LINUX_APT,
+    ('linux', 'apt-get'): _LINUX_APT,
+    ('linux', 'yum'): MappingProxyType({'yum': "sudo yum install ffmpeg", **_LINUX_COMMON}),
+    ('linux', 'dnf'): MappingProxyType({'dnf': "sudo dnf install ffmpeg", **_LINUX_COMMON}),
+    ('linux', 'pacman'): MappingProxyType({'pacman': "sudo pacman -S ffmpeg", **_LINUX_COMMON}),
+    ('linux', None): MappingProxyType({
+        'generic': "Use your distribution's package manager to install ffmpeg",
+        **_LINUX_COMMON,
+    }),
+    ('windows', 'choco'): MappingProxyType({'chocolatey': "choco install ffmpeg", **_WINDOWS_COMMON}),
+    ('windows', None): MappingProxyType(_WINDOWS_COMMON),
+    (None, None): MappingProxyType({
+        'manual': "Visit https://ffmpeg.org/download.html for installation instructions",
+    }),
+})
+
 
 def check_ffmpeg_codecs() -> dict[str, bool]:
     """Check if required codecs are available in FFmpeg.
 
+    The probe runs once per process; see clear_probe_caches().
+
     Returns:
         dict[str, bool]: Dictionary mapping codec names to availability
     """
-    required_codecs = {
-        "libx264": False,
-        "libx265": False,
-        "aac": False,
-    }
+    return dict(_probe_ffmpeg_codecs())
+
 
+@lru_cache(maxsize=1)
+def _probe_ffmpeg_codecs() -> Tuple[Tuple[str, bool], ...]:
+    """Run ``ffmpeg -encoders`` and report the required codecs.
+
+    Returns:
+        Tuple[Tuple[str, bool], ...]: (codec, available) pairs, kept immutable
+        because the result is cached
+    """
     try:
-        # Get list of available encoders
+        # Get list of available encoders; encoder names are ASCII, so the
+        # raw bytes are searched without decoding
         result = subprocess.run(
-            ["ffmpeg", "-encoders"],
+            ["ffmpeg", "-hide_banner", "-encoders"],
             capture_output=True,
-            text=True,
-            timeout=10
+            timeout=10,
+            check=False
         )
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        logger.error(f"Failed to check FFmpeg codecs: {e}")
+        return tuple((codec, False) for codec in _REQUIRED_CODECS)
 
-        output = result.stdout.lower()
+    if result.returncode != 0:
+        logger.error(f"Failed to check FFmpeg codecs: ffmpeg exited with code {result.returncode}")
+        return tuple((codec, False) for codec in _REQUIRED_CODECS)
 
-        # Check each required codec
-        for codec in required_codecs.keys():
-            if codec.lower() in output:
-                required_codecs[codec] = True
+    # Find all required codecs in one pass over the output
+    found = {match.group(1).lower() for match in _CODEC_RE.finditer(result.stdout)}
 
-        return required_codecs
-    except Exception as e:
-        logger.error(f"Failed to check FFmpeg codecs: {e}")
-        return required_codecs
+    return tuple((codec, codec.encode() in found) for codec in _REQUIRED_CODECS)
 
 
+@lru_cache(maxsize=1)
 def check_subtitle_support() -> bool:
     """Check if FFmpeg has subtitle filter support.
 
+    The probe runs once per process; see clear_probe_caches().
+
     Returns:
         bool: True if subtitle filter is available
     """
     try:
         result = subprocess.run(
-            ["ffmpeg", "-filters"],
+            ["ffmpeg", "-hide_banner", "-filters"],
             capture_output=True,
-            text=True,
-            timeout=10
+            timeout=10,
+            check=False
         )
-
-        return "subtitles" in result.stdout.lower()
-    except Exception:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
+    return result.returncode == 0 and b"subtitles" in result.stdout
 
+
+def clear_probe_caches() -> None:
+    """Forget cached FFmpeg probe results.
+
+    Must be called after FFmpeg is installed or changed within the same
+    process, otherwise the cached "not available" answers are reused.
+    """
+    _probe_ffmpeg_codecs.cache_clear()
+    check_subtitle_support.cache_clear()
+    utils_clear_probe_caches()
+
+
+@lru_cache(maxsize=1)
 def detect_os() -> Tuple[str, str]:
     """Detect the operating system.
 
+    The OS type comes from ``sys.platform``; the descriptive name is only
+    looked up for the detected OS, and the result is cached.
+
     Returns:
         Tuple[str, str]: (os_type, os_name) where os_type is one of:
             'darwin' (macOS), 'linux', 'windows', 'unknown'
     """
-    system = platform.system().lower()
-    os_name = platform.platform()
-
-    if system == 'darwin':
+    if sys.platform == 'darwin':
         return 'darwin', f"macOS {platform.mac_ver()[0]}"
-    elif system == 'linux':
-        # Try to get Linux distribution info
-        try:
-            import distro
-            dist_name = distro.name(pretty=True)
-            return 'linux', dist_name
-        except ImportError:
-            return 'linux', os_name
-    elif system == 'windows':
-        return 'windows', os_name
+    elif sys.platform.startswith('linux'):
+        # Prefer the Linux distribution name when distro is installed
+        if distro is not None:
+            return 'linux', distro.name(pretty=True)
+        return 'linux', platform.platform()
+    elif sys.platform == 'win32':
+        return 'windows', platform.platform()
     else:
-        return 'unknown', os_name
+        return 'unknown', platform.platform()
 
 
 def check_package_manager() -> Optional[str]:
@@ -119,25 +194,33 @@ def check_package_manager() -> Optional[str]:
     Returns:
         Optional[str]: Package manager name ('brew', 'apt', 'yum', 'dnf', 'pacman', 'choco', etc.)
     """
-    package_managers = {
-        'brew': '/usr/local/bin/brew',  # macOS Homebrew
-        'apt': '/usr/bin/apt',          # Debian/Ubuntu
-        'apt-get': '/usr/bin/apt-get',  # Debian/Ubuntu (older)
-        'yum': '/usr/bin/yum',          # RHEL/CentOS
-        'dnf': '/usr/bin/dnf',          # Fedora
-        'pacman': '/usr/bin/pacman',    # Arch Linux
-        'choco': 'C:\\ProgramData\\chocolatey\\bin\\choco.exe',  # Windows Chocolatey
-    }
-
-    for pm_name, pm_path in package_managers.items():
-        # Check using shutil.which for cross-platform compatibility
-        if shutil.which(pm_name):
-            return pm_name
+    # List every PATH directory once instead of probing it per candidate
+    windows = sys.platform == 'win32'
+    names: set[str] = set()
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as it:
+                names.update(entry.name.lower() if windows else entry.name for entry in it)
+        except OSError:
+            continue
+
+    suffixes = [''] + (
+        [ext.lower() for ext in os.environ.get('PATHEXT', '.EXE').split(os.pathsep)]
+        if windows else []
+    )
+
+    for pm_name in _PACKAGE_MANAGERS:
+        if any(pm_name + suffix in names for suffix in suffixes):
+            # Confirm the match is actually executable, as before
+            if shutil.which(pm_name):
+                return pm_name
 
     return None
 
 
-def get_installation_instructions(os_type: str, package_manager: Optional[str] = None) -> dict[str, str]:
+def get_installation_instructions(os_type: str, package_manager: Optional[str] = None) -> Mapping[str, str]:
     """Get installation instructions for the detected OS.
 
     Args:
@@ -145,39 +228,11 @@ def get_installation_instructions(os_type: str, package_manager: Optional[str] =
         package_manager: Detected package manager (optional)
 
     Returns:
-        dict[str, str]: Dictionary with installation methods
+        Mapping[str, str]: Read-only mapping of installation methods
     """
-    instructions = {}
-
-    if os_type == 'darwin':
-        instructions['homebrew'] = "brew install ffmpeg"
-        instructions['macports'] = "sudo port install ffmpeg"
-        instructions['manual'] = "Download from: https://evermeet.cx/ffmpeg/"
-
-    elif os_type == 'linux':
-        if package_manager == 'apt' or package_manager == 'apt-get':
-            instructions['apt'] = "sudo apt update && sudo apt install ffmpeg"
-        elif package_manager == 'yum':
-            instructions['yum'] = "sudo yum install ffmpeg"
-        elif package_manager == 'dnf':
-            instructions['dnf'] = "sudo dnf install ffmpeg"
-        elif package_manager == 'pacman':
-            instructions['pacman'] = "sudo pacman -S ffmpeg"
-        else:
-            instructions['generic'] = "Use your distribution's package manager to install ffmpeg"
-        instructions['snap'] = "sudo snap install ffmpeg"
-        instructions['manual'] = "Download from: https://ffmpeg.org/download.html#build-linux"
-
-    elif os_type == 'windows':
-        if package_manager == 'choco':
-            instructions['chocolatey'] = "choco install ffmpeg"
-        instructions['scoop'] = "scoop install ffmpeg"
-        instructions['winget'] = "winget install ffmpeg"
-        instructions['manual'] = "Download from: https://ffmpeg.org/download.html#build-windows"
-
-    else:
-        instructions['manual'] = "Visit https://ffmpeg.org/download.html for installation instructions"
-
+    instructions = _INSTRUCTIONS.get((os_type, package_manager))
+    if instructions is None:
+        instructions = _INSTRUCTIONS.get((os_type, None), _INSTRUCTIONS[(None, None)])
     return instructions
 
 
@@ -328,111 +383,125 @@ def main() -> int:
     logger.remove()
     logger.add(sys.stderr, format="<level>{level: <8}</level> | <level>{message}</level>", level="INFO")
 
-    # Detect OS and package manager
-    os_type, os_name = detect_os()
-    package_manager = check_package_manager()
+    # The probes are separate FFmpeg/FFprobe processes, so they run side by
+    # side (with OS detection on this thread) and each step below only waits
+    # for the result it reports
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ffmpeg_probe = executor.submit(validate_ffmpeg)
+        ffprobe_probe = executor.submit(validate_ffprobe)
 
-    print(f"🖥️  Detected OS: {os_name}")
-    if package_manager:
-        print(f"📦 Package Manager: {package_manager}")
-    else:
-        print(f"📦 Package Manager: Not detected")
-    print()
-
-    # Step 1: Check FFmpeg
-    print("🔍 Checking FFmpeg installation...")
-    ffmpeg_installed = validate_ffmpeg()
-
-    if ffmpeg_installed:
-        version = get_ffmpeg_version()
-        print(f"✅ FFmpeg is installed")
-        if version:
-            print(f"   Version: {version}")
-    else:
-        print("❌ FFmpeg is NOT installed or not accessible")
-
-        # Get installation instructions
-        instructions = get_installation_instructions(os_type, package_manager)
-
-        if args.install:
-            # Attempt automatic installation
-            if package_manager:
-                print(f"\n💡 Automatic installation is available for your system.")
-                response = input("   Do you want to install FFmpeg now? (yes/no): ").lower().strip()
-
-                if response in ['yes', 'y']:
-                    if install_ffmpeg_auto(os_type, package_manager):
-                        # Verify installation
-                        print("\n🔍 Verifying installation...")
-                        if validate_ffmpeg():
-                            print("✅ FFmpeg is now installed and working!")
-                            ffmpeg_installed = True
+        # Detect OS and package manager
+        os_type, os_name = detect_os()
+        package_manager = check_package_manager()
+
+        print(f"🖥️  Detected OS: {os_name}")
+        if package_manager:
+            print(f"📦 Package Manager: {package_manager}")
+        else:
+            print(f"📦 Package Manager: Not detected")
+        print()
+
+        # Step 1: Check FFmpeg
+        print("🔍 Checking FFmpeg installation...")
+        ffmpeg_installed = ffmpeg_probe.result()
+
+        if ffmpeg_installed:
+            codecs_probe = executor.submit(check_ffmpeg_codecs)
+            subtitles_probe = executor.submit(check_subtitle_support)
+            version = get_ffmpeg_version()  # cached by the probe above
+            print(f"✅ FFmpeg is installed")
+            if version:
+                print(f"   Version: {version}")
+        else:
+            print("❌ FFmpeg is NOT installed or not accessible")
+
+            # Get installation instructions
+            instructions = get_installation_instructions(os_type, package_manager)
+
+            if args.install:
+                # Attempt automatic installation
+                if package_manager:
+                    print(f"\n💡 Automatic installation is available for your system.")
+                    response = input("   Do you want to install FFmpeg now? (yes/no): ").lower().strip()
+
+                    if response in _YES:
+                        if install_ffmpeg_auto(os_type, package_manager):
+                            # Verify installation; drop any probe results cached
+                            # before FFmpeg was installed
+                            clear_probe_caches()
+                            print("\n🔍 Verifying installation...")
+                            if validate_ffmpeg():
+                                print("✅ FFmpeg is now installed and working!")
+                                ffmpeg_installed = True
+                                ffprobe_probe = executor.submit(validate_ffprobe)
+                                codecs_probe = executor.submit(check_ffmpeg_codecs)
+                                subtitles_probe = executor.submit(check_subtitle_support)
+                            else:
+                                print("⚠️  Installation completed but FFmpeg is not accessible.")
+                                print("   You may need to restart your terminal or update your PATH.")
+                                return 1
                         else:
-                            print("⚠️  Installation completed but FFmpeg is not accessible.")
-                            print("   You may need to restart your terminal or update your PATH.")
-                            return 1
+                            print("\n⚠️  Automatic installation failed.")
+                            print("   Please try manual installation using the instructions below.")
                     else:
-                        print("\n⚠️  Automatic installation failed.")
-                        print("   Please try manual installation using the instructions below.")
+                        print("\n⚠️  Installation cancelled.")
                 else:
-                    print("\n⚠️  Installation cancelled.")
-            else:
-                print("\n⚠️  Automatic installation is not available for your system.")
-                print("   Please install FFmpeg manually using the instructions below.")
-
-        # Show installation instructions
-        if not ffmpeg_installed:
-            print("\n💡 Installation instructions for your system:")
-            print("="*60)
-            for method, command in instructions.items():
-                print(f"\n{method.upper()}:")
-                print(f"   {command}")
-            print("\n" + "="*60)
-
-            if not args.install:
-                print("\n💡 TIP: Run this script with --install to attempt automatic installation:")
-                print(f"   python {sys.argv[0]} --install")
-
+                    print("\n⚠️  Automatic installation is not available for your system.")
+                    print("   Please install FFmpeg manually using the instructions below.")
+
+            # Show installation instructions
+            if not ffmpeg_installed:
+                print("\n💡 Installation instructions for your system:")
+                print("="*60)
+                for method, command in instructions.items():
+                    print(f"\n{method.upper()}:")
+                    print(f"   {command}")
+                print("\n" + "="*60)
+
+                if not args.install:
+                    print("\n💡 TIP: Run this script with --install to attempt automatic installation:")
+                    print(f"   python {sys.argv[0]} --install")
+
+                return 1
+
+        # Step 2: Check FFprobe
+        print("\n🔍 Checking FFprobe installation...")
+        if ffprobe_probe.result():
+            print("✅ FFprobe is installed")
+        else:
+            print("⚠️  FFprobe is NOT installed (optional but recommended)")
+
+        # Step 3: Check required codecs
+        print("\n🔍 Checking required codecs...")
+        codecs = codecs_probe.result()
+
+        all_codecs_available = True
+        for codec, available in codecs.items():
+            status = "✅" if available else "❌"
+            print(f"{status} {codec}: {'Available' if available else 'NOT Available'}")
+            if not available:
+                all_codecs_available = False
+
+        if not all_codecs_available:
+            print("\n⚠️  Some required codecs are missing!")
+            print("   You may need to reinstall FFmpeg with full codec support.")
             return 1
 
-    # Step 2: Check FFprobe
-    print("\n🔍 Checking FFprobe installation...")
-    if validate_ffprobe():
-        print("✅ FFprobe is installed")
-    else:
-        print("⚠️  FFprobe is NOT installed (optional but recommended)")
-
-    # Step 3: Check required codecs
-    print("\n🔍 Checking required codecs...")
-    codecs = check_ffmpeg_codecs()
-
-    all_codecs_available = True
-    for codec, available in codecs.items():
-        status = "✅" if available else "❌"
-        print(f"{status} {codec}: {'Available' if available else 'NOT Available'}")
-        if not available:
-            all_codecs_available = False
-
-    if not all_codecs_available:
-        print("\n⚠️  Some required codecs are missing!")
-        print("   You may need to reinstall FFmpeg with full codec support.")
-        return 1
-
-    # Step 4: Check subtitle support
-    print("\n🔍 Checking subtitle filter support...")
-    if check_subtitle_support():
-        print("✅ Subtitle filter is available")
-    else:
-        print("⚠️  Subtitle filter is NOT available")
-        print("   Hard-coded subtitles may not work properly.")
-        return 1
+        # Step 4: Check subtitle support
+        print("\n🔍 Checking subtitle filter support...")
+        if subtitles_probe.result():
+            print("✅ Subtitle filter is available")
+        else:
+            print("⚠️  Subtitle filter is NOT available")
+            print("   Hard-coded subtitles may not work properly.")
+            return 1
 
-    # Final summary
-    print("\n" + "="*60)
-    print("✅ All checks passed! FFmpeg is properly configured.")
-    print("="*60 + "\n")
+        # Final summary
+        print("\n" + "="*60)
+        print("✅ All checks passed! FFmpeg is properly configured.")
+        print("="*60 + "\n")
 
-    return 0
+        return 0
 
 
 if __name__ == "__main__":
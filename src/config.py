@@ -1,10 +1,22 @@
 """Configuration management with validation."""
 
+import os
+import secrets
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Literal, Optional
+from pydantic import BaseModel, Field, StringConstraints
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import yaml
+
+# Allowed option values; pydantic-core checks these without Python callbacks
+VideoPreset = Literal[
+    "ultrafast", "superfast", "veryfast", "faster",
+    "fast", "medium", "slow", "slower", "veryslow"
+]
+VideoCodec = Literal["libx264", "libx265", "h264", "hevc"]
+AudioCodec = Literal["aac", "mp3", "opus", "ac3"]
+HardwareAccel = Literal["none", "auto", "nvenc", "videotoolbox", "qsv", "vaapi"]
+Bitrate = Annotated[str, StringConstraints(pattern=r"^\d+(\.\d+)?[kM]$")]
 
 
 class VideoConfig(BaseModel):
@@ -15,6 +27,8 @@ class VideoConfig(BaseModel):
         codec: Video codec to use (libx264, libx265, etc.)
         crf: Constant Rate Factor (0-51, lower = better quality)
         preset: Encoding speed preset (ultrafast to veryslow)
+        hardware_accel: Hardware encoder backend ('none' keeps the software
+            encoder, 'auto' picks one FFmpeg provides on this machine)
     """
 
     resolution: int = Field(
@@ -23,7 +37,7 @@ class VideoConfig(BaseModel):
         ge=144,
         le=2160
     )
-    codec: str = Field(
+    codec: VideoCodec = Field(
         default="libx264",
         description="Video codec"
     )
@@ -33,55 +47,14 @@ class VideoConfig(BaseModel):
         le=51,
         description="Constant Rate Factor (quality)"
     )
-    preset: str = Field(
+    preset: VideoPreset = Field(
         default="medium",
         description="Encoding preset"
     )
-
-    @field_validator("preset")
-    @classmethod
-    def validate_preset(cls, v: str) -> str:
-        """Validate FFmpeg preset.
-
-        Args:
-            v: Preset value to validate
-
-        Returns:
-            Validated preset value
-
-        Raises:
-            ValueError: If preset is not valid
-        """
-        valid_presets = [
-            "ultrafast", "superfast", "veryfast", "faster",
-            "fast", "medium", "slow", "slower", "veryslow"
-        ]
-        if v not in valid_presets:
-            raise ValueError(
-                f"Invalid preset '{v}'. Choose from: {', '.join(valid_presets)}"
-            )
-        return v
-
-    @field_validator("codec")
-    @classmethod
-    def validate_codec(cls, v: str) -> str:
-        """Validate video codec.
-
-        Args:
-            v: Codec value to validate
-
-        Returns:
-            Validated codec value
-
-        Raises:
-            ValueError: If codec is not supported
-        """
-        valid_codecs = ["libx264", "libx265", "h264", "hevc"]
-        if v not in valid_codecs:
-            raise ValueError(
-                f"Invalid codec '{v}'. Choose from: {', '.join(valid_codecs)}"
-            )
-        return v
+    hardware_accel: HardwareAccel = Field(
+        default="none",
+        description="Hardware encoder backend"
+    )
 
 
 class AudioConfig(BaseModel):
@@ -92,56 +65,15 @@ class AudioConfig(BaseModel):
         bitrate: Audio bitrate (e.g., '128k', '192k')
     """
 
-    codec: str = Field(
+    codec: AudioCodec = Field(
         default="aac",
         description="Audio codec"
     )
-    bitrate: str = Field(
+    bitrate: Bitrate = Field(
         default="128k",
-        description="Audio bitrate"
+        description="Audio bitrate (number followed by 'k' or 'M')"
     )
 
-    @field_validator("codec")
-    @classmethod
-    def validate_codec(cls, v: str) -> str:
-        """Validate audio codec.
-
-        Args:
-            v: Codec value to validate
-
-        Returns:
-            Validated codec value
-
-        Raises:
-            ValueError: If codec is not supported
-        """
-        valid_codecs = ["aac", "mp3", "opus", "ac3"]
-        if v not in valid_codecs:
-            raise ValueError(
-                f"Invalid codec '{v}'. Choose from: {', '.join(valid_codecs)}"
-            )
-        return v
-
-    @field_validator("bitrate")
-    @classmethod
-    def validate_bitrate(cls, v: str) -> str:
-        """Validate audio bitrate format.
-
-        Args:
-            v: Bitrate value to validate
-
-        Returns:
-            Validated bitrate value
-
-        Raises:
-            ValueError: If bitrate format is invalid
-        """
-        if not v.endswith("k") and not v.endswith("M"):
-            raise ValueError(
-                f"Invalid bitrate format '{v}'. Must end with 'k' or 'M' (e.g., '128k', '0.5M')"
-            )
-        return v
-
 
 class SubtitleConfig(BaseModel):
     """Subtitle processing settings.
@@ -249,9 +181,32 @@ class Config(BaseSettings):
         self.logs_folder.mkdir(parents=True, exist_ok=True)
 
 
+@cache
+def _yaml_codecs() -> tuple[Any, Any]:
+    """Import PyYAML on first use and pick its fastest safe loader and dumper.
+
+    PyYAML is only needed when a config file is read or written, so it is
+    not imported with this module.
+
+    Returns:
+        tuple[Any, Any]: (Loader, Dumper), libyaml-backed when available
+    """
+    try:
+        from yaml import CSafeDumper as dumper, CSafeLoader as loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as dumper, SafeLoader as loader  # type: ignore[assignment]
+    return loader, dumper
+
+
 def load_config(config_path: str | Path = "config.yaml") -> Config:
     """Load and validate configuration from YAML file.
 
+    Parsed files are memoized on their path, mtime and size and on the
+    CONVERTER_* environment and .env file that pydantic-settings also reads,
+    so repeated loads with unchanged inputs skip YAML parsing and validation. Every call
+    returns an independent copy that is safe to modify; use
+    ``clear_config_cache()`` to drop the memoized results.
+
     Args:
         config_path: Path to the YAML configuration file
 
@@ -275,9 +230,39 @@ def load_config(config_path: str | Path = "config.yaml") -> Config:
         print(f"Warning: Config file '{config_path}' not found. Using default configuration.")
         return Config()
 
+    stat = config_file.stat()
+    cached = _load_cached(
+        str(config_file.resolve()), stat.st_mtime_ns, stat.st_size, _settings_fingerprint()
+    )
+
+    # Hand out a copy so callers can mutate it without polluting the cache
+    return cached.model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int, settings: tuple) -> Config:
+    """Parse and validate a config file, memoized on its stat signature.
+
+    The mtime, size and settings arguments only form part of the cache key,
+    so a file changed on disk or a changed environment gets a new key and
+    the file is parsed again.
+
+    Args:
+        path: Resolved path to the YAML configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        settings: Environment fingerprint from _settings_fingerprint()
+
+    Returns:
+        Validated Config object (shared, do not mutate)
+    """
+    import yaml
+
+    loader, _ = _yaml_codecs()
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
+        # Hand libyaml the raw bytes; it detects the encoding itself
+        with open(path, "rb") as f:
+            config_data = yaml.load(f.read(), Loader=loader)
 
         if config_data is None:
             config_data = {}
@@ -288,9 +273,55 @@ def load_config(config_path: str | Path = "config.yaml") -> Config:
         raise ValueError(f"Invalid YAML in config file: {e}") from e
 
 
+def clear_config_cache() -> None:
+    """Drop the configs memoized by load_config (e.g. between tests)."""
+    _load_cached.cache_clear()
+
+
+def _settings_fingerprint() -> tuple:
+    """Capture the non-YAML inputs that can change a loaded Config.
+
+    Returns:
+        tuple: CONVERTER_* environment variables and the .env file mtime
+    """
+    env_vars = tuple(sorted(
+        (key, value) for key, value in os.environ.items()
+        if key.upper().startswith("CONVERTER_")
+    ))
+    try:
+        env_file_mtime: Optional[int] = os.stat(".env").st_mtime_ns
+    except OSError:
+        env_file_mtime = None
+    return env_vars, env_file_mtime
+
+
+def _create_temp_sibling(path: Path) -> tuple[int, str]:
+    """Create an empty temp file next to ``path`` for an atomic replace.
+
+    Unlike tempfile.mkstemp(), which always uses mode 0o600, the file is
+    created with 0o666 so the kernel applies the umask as for a plain open().
+
+    Args:
+        path: File the temp file will later replace
+
+    Returns:
+        tuple[int, str]: Open write descriptor and path of the temp file
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}")
+        try:
+            return os.open(tmp_name, flags, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
 def save_config(config: Config, config_path: str | Path = "config.yaml") -> None:
     """Save configuration to YAML file.
 
+    The file is written to a temporary sibling and atomically renamed over
+    the target, so an interrupted save leaves the previous file intact.
+
     Args:
         config: Config object to save
         config_path: Path where to save the configuration
@@ -312,6 +343,7 @@ def save_config(config: Config, config_path: str | Path = "config.yaml") -> None
             "codec": config.video.codec,
             "crf": config.video.crf,
             "preset": config.video.preset,
+            "hardware_accel": config.video.hardware_accel,
         },
         "audio": {
             "codec": config.audio.codec,
@@ -328,5 +360,36 @@ def save_config(config: Config, config_path: str | Path = "config.yaml") -> None
         "verbose": config.verbose,
     }
 
-    with open(config_file, "w", encoding="utf-8") as f:
-        yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False, indent=2)
+    import yaml
+
+    _, dumper = _yaml_codecs()
+    data = yaml.dump(
+        config_dict,
+        Dumper=dumper,
+        default_flow_style=False,
+        sort_keys=False,
+        indent=2,
+    ).encode("utf-8")
+
+    # Keep the permissions of an existing file; a new one gets the umask
+    # applied when its temp file is created
+    try:
+        mode: Optional[int] = config_file.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = None
+
+    # Write to a temp file in the same folder and rename it over the target,
+    # so an interrupted save never leaves a truncated config behind
+    fd, tmp_name = _create_temp_sibling(config_file)
+    try:
+        # os.fchmod is missing on Windows before Python 3.13
+        if mode is not None and hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, config_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -1,13 +1,113 @@
 """Core conversion logic for batch MKV to MP4 conversion."""
 
+import os
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import cache
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 import subprocess
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from loguru import logger
 
 from src.config import Config
+from src.utils import get_audio_info, get_available_encoders, get_video_info
+
+# Worker threads used to list subdirectories of the input tree
+_SCAN_WORKERS = 8
+
+# Bytes per megabyte, for the sizes reported in ConversionResult
+_MB = 1024 * 1024
+
+# FFmpeg stderr lines kept for the error message of a failed conversion
+_STDERR_TAIL_LINES = 200
+
+# Characters FFmpeg treats specially in a filter option value, and in the
+# filtergraph description that contains the filter
+_FILTER_OPTION_SPECIAL = re.compile(r"([\\:'])")
+_FILTERGRAPH_SPECIAL = re.compile(r"([\\'\[\],;])")
+
+# Codec family of each configured video codec, used to name hardware encoders
+_CODEC_FAMILIES = {"libx264": "h264", "h264": "h264", "libx265": "hevc", "hevc": "hevc"}
+
+# Hardware backends tried by hardware_accel "auto", per platform
+_AUTO_HW_BACKENDS = ("nvenc", "qsv", "vaapi")
+_AUTO_HW_BACKENDS_DARWIN = ("videotoolbox",)
+
+# Constant-quality option each hardware encoder takes in place of -crf, on
+# the same 0-51 scale (VideoToolbox's -q:v is converted separately)
+_HW_QUALITY_FLAGS = {"nvenc": "-cq", "qsv": "-global_quality", "vaapi": "-qp"}
+
+# Multipliers of the audio bitrate suffixes allowed by the config
+_BITRATE_SCALES = {"k": 1_000, "M": 1_000_000}
+
+# Folder holding the DRM render nodes VAAPI encoders run on
+_DRI_FOLDER = "/dev/dri"
+
+
+def _escape_filter_path(path: Path) -> str:
+    """Escape a file path for use as a filter option inside ``-vf``.
+
+    FFmpeg unescapes filter arguments twice (once for the filtergraph, once
+    for the option list), so both levels of escaping are applied.
+
+    Args:
+        path: File path to embed, e.g. the input for the subtitles filter
+
+    Returns:
+        str: Escaped path, unchanged if it has no special characters
+    """
+    escaped = _FILTER_OPTION_SPECIAL.sub(r"\\\1", str(path))
+    return _FILTERGRAPH_SPECIAL.sub(r"\\\1", escaped)
+
+
+@cache
+def _find_vaapi_device() -> str | None:
+    """Return the first DRM render node (e.g. /dev/dri/renderD128), if any.
+
+    Returns:
+        str | None: Device path for -vaapi_device, or None without a GPU
+    """
+    try:
+        nodes = sorted(name for name in os.listdir(_DRI_FOLDER) if name.startswith("renderD"))
+    except OSError:
+        return None
+    return os.path.join(_DRI_FOLDER, nodes[0]) if nodes else None
+
+
+def _scan_dir(path: str) -> tuple[list[os.DirEntry], list[str]]:
+    """List one directory, splitting it into MKV file entries and subfolders.
+
+    The ``.mkv`` extension is matched case-insensitively. Hidden files and
+    directories are skipped and directory symlinks are not followed. A
+    directory that can't be read is skipped with a warning.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        tuple[list[os.DirEntry], list[str]]: MKV file entries and subfolder paths
+    """
+    mkv_entries: list[os.DirEntry] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(".mkv") and entry.is_file():
+                    mkv_entries.append(entry)
+    except OSError as e:
+        logger.warning(f"Skipping unreadable folder {path}: {e}")
+        return [], []
+    return mkv_entries, subdirs
 
 
 @dataclass
@@ -50,19 +150,131 @@ class BatchConverter:
             config: Configuration object with conversion settings
         """
         self.config: Config = config
+        # Output folders already created, so each is only mkdir'ed once
+        self._ensured_dirs: set[Path] = set()
         self._ensure_directories()
+        self._prepare_ffmpeg_args()
+
+    def _prepare_ffmpeg_args(self) -> None:
+        """Pre-build the parts of the FFmpeg command that don't depend on the file.
+
+        The video encoder options are only built by _prepare_encoder_args()
+        when the first encode command is, since picking a hardware encoder
+        may need to probe FFmpeg.
+        """
+        audio = self.config.audio
+        subtitles = self.config.subtitles
+
+        # Subtitle filter options appended after "subtitles=<input>"
+        subtitle_options = ""
+        if subtitles.enabled:
+            # Add language specification if provided
+            if subtitles.language:
+                subtitle_options += f":si={subtitles.language}"
+            # Add custom style if provided
+            if subtitles.force_style:
+                subtitle_options += f":force_style='{subtitles.force_style}'"
+        self._subtitle_options: str = subtitle_options
+
+        # Audio options used when the video stream is copied as-is: the
+        # audio is copied too if it already matches, otherwise re-encoded
+        # since MKV audio (FLAC, DTS, ...) may not fit in MP4
+        self._audio_copy_args: tuple[str, ...] = ("-c:a", "copy")
+        self._audio_encode_args: tuple[str, ...] = ("-acodec", audio.codec, "-b:a", audio.bitrate)
+        self._audio_bitrate_bps: float = (
+            float(audio.bitrate[:-1]) * _BITRATE_SCALES[audio.bitrate[-1]]
+        )
+
+        # Set by _prepare_encoder_args() on first use
+        self._encoder_lock = threading.Lock()
+        self._encode_args: tuple[str, ...] | None = None
+
+    def _prepare_encoder_args(self) -> None:
+        """Build the video encoder parts of the FFmpeg command, once."""
+        with self._encoder_lock:
+            if self._encode_args is not None:
+                return
+
+            video = self.config.video
+            audio = self.config.audio
+
+            backend = self._resolve_hardware_accel()
+            encoder = f"{_CODEC_FAMILIES[video.codec]}_{backend}" if backend else video.codec
+
+            # Options placed before "-i", needed by encoders that run on a device
+            self._input_args: tuple[str, ...] = (
+                ("-vaapi_device", _find_vaapi_device()) if backend == "vaapi" else ()
+            )
+
+            self._scale_filter: str = f"scale=-2:{video.resolution}"
+            if backend == "vaapi":
+                # VAAPI encodes from GPU surfaces, so upload the scaled frames
+                self._scale_filter += ",format=nv12,hwupload"
+
+            # Hardware encoders don't take -crf or the x264/x265 preset names
+            if backend is None:
+                quality_args: tuple[str, ...] = ("-crf", str(video.crf), "-preset", video.preset)
+            elif backend == "videotoolbox":
+                # -q:v runs 1-100 with higher meaning better, the reverse of CRF
+                quality_args = ("-q:v", str(max(1, round(100 - video.crf * 100 / 51))))
+            else:
+                quality_args = (_HW_QUALITY_FLAGS[backend], str(video.crf))
+
+            self._encode_args = (
+                "-vcodec", encoder,
+                "-acodec", audio.codec,
+                *quality_args,
+                "-b:a", audio.bitrate,
+                "-movflags", "+faststart",
+            )
+
+    def _resolve_hardware_accel(self) -> str | None:
+        """Pick the hardware encoder backend to use.
+
+        Returns:
+            str | None: Backend name (e.g. "nvenc"), or None for the software encoder
+        """
+        setting = self.config.video.hardware_accel
+        if setting == "none":
+            return None
+
+        family = _CODEC_FAMILIES[self.config.video.codec]
+        available = get_available_encoders()
+
+        if setting != "auto":
+            if f"{family}_{setting}" not in available:
+                logger.warning(
+                    f"FFmpeg has no {family}_{setting} encoder, using software encoding"
+                )
+                return None
+            if setting == "vaapi" and _find_vaapi_device() is None:
+                logger.warning(f"No VAAPI device in {_DRI_FOLDER}, using software encoding")
+                return None
+            return setting
+        backends = _AUTO_HW_BACKENDS_DARWIN if sys.platform == "darwin" else _AUTO_HW_BACKENDS
+        for backend in backends:
+            if backend == "vaapi" and _find_vaapi_device() is None:
+                continue
+            if f"{family}_{backend}" in available:
+                logger.info(f"Using hardware encoder {family}_{backend}")
+                return backend
+
+        logger.info("No hardware encoder found, using software encoding")
+        return None
 
     def _ensure_directories(self) -> None:
         """Create output and logs directories if they don't exist."""
         self.config.output_folder.mkdir(parents=True, exist_ok=True)
         self.config.logs_folder.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(self.config.output_folder)
         logger.debug(f"Ensured directories exist: output={self.config.output_folder}, logs={self.config.logs_folder}")
 
     def scan_input_folder(self) -> list[Path]:
         """Scan input folder for MKV files.
 
         Recursively searches the input directory for .mkv files,
-        filtering out hidden files and system files.
+        filtering out hidden files and system files. Hidden directories
+        are pruned during the walk, so their subtrees are never listed.
 
         Returns:
             list[Path]: Sorted list of MKV file paths found
@@ -72,6 +284,24 @@ class BatchConverter:
             >>> mkv_files = converter.scan_input_folder()
             >>> print(f"Found {len(mkv_files)} MKV files")
         """
+        return [Path(entry.path) for entry in self.scan_input_folder_entries()]
+
+    def scan_input_folder_entries(self) -> list[os.DirEntry]:
+        """Scan input folder for MKV files as directory entries.
+
+        Walks the tree with os.scandir (listing subfolders on a small thread
+        pool), skipping hidden entries and not following directory symlinks,
+        and returns the DirEntry objects, so callers can read names and sizes
+        without a separate stat() call per file. scan_input_folder() returns
+        the same files as Paths.
+
+        Returns:
+            list[os.DirEntry]: MKV file entries sorted by path
+
+        Examples:
+            >>> entries = converter.scan_input_folder_entries()
+            >>> sizes = {e.name: e.stat().st_size for e in entries}
+        """
         input_path: Path = self.config.input_folder
 
         if not input_path.exists():
@@ -82,23 +312,61 @@ class BatchConverter:
             logger.error(f"Input path is not a directory: {input_path}")
             return []
 
-        # Recursively find all .mkv files
-        all_mkv_files: list[Path] = list(input_path.glob("**/*.mkv"))
+        entries, subdirs = _scan_dir(str(input_path))
 
-        # Filter out hidden files (files/directories starting with .)
-        mkv_files: list[Path] = [
-            f for f in all_mkv_files
-            if not any(part.startswith('.') for part in f.parts)
-        ]
+        # Subfolders are listed concurrently; a flat folder needs no threads.
+        # _scan_dir already skips unreadable folders, so anything a future
+        # raises is unexpected: drop the queued listings and re-raise it.
+        if subdirs:
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+                pending: set[Future] = {executor.submit(_scan_dir, d) for d in subdirs}
+                try:
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            mkv_entries, subdirs = future.result()
+                            entries.extend(mkv_entries)
+                            pending.update(executor.submit(_scan_dir, d) for d in subdirs)
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        # Sort by path components, matching the ordering of sorted(Path)
+        entries.sort(key=lambda e: e.path.split(os.sep))
+
+        logger.info(f"Found {len(entries)} MKV file(s) in {input_path}")
+        if entries:
+            logger.debug(f"Files to process: {[e.name for e in entries]}")
+
+        return entries
+
+    def _output_basename(self, input_name: str) -> str:
+        """Return the output file name (without folder) for an input file name.
+
+        Works on plain strings so callers holding DirEntry names don't need
+        to build a Path per file.
+
+        Args:
+            input_name: Input file name, e.g. "avatar.mkv"
 
-        # Sort alphabetically for consistent processing
-        mkv_files = sorted(mkv_files)
+        Returns:
+            str: Output file name, e.g. "avatar_480p.mp4"
+        """
+        return f"{os.path.splitext(input_name)[0]}_{self.config.video.resolution}p.mp4"
 
-        logger.info(f"Found {len(mkv_files)} MKV file(s) in {input_path}")
-        if mkv_files:
-            logger.debug(f"Files to process: {[f.name for f in mkv_files]}")
+    def _output_dir_for(self, input_dir: str) -> str:
+        """Return the output folder mirroring an input folder, as a string.
 
-        return mkv_files
+        Args:
+            input_dir: Folder inside the input folder, as found by
+                scan_input_folder_entries()
+
+        Returns:
+            str: Matching folder inside the output folder (not created)
+        """
+        relative = input_dir[len(str(self.config.input_folder)):].lstrip(os.sep)
+        output_root = str(self.config.output_folder)
+        return os.path.join(output_root, relative) if relative else output_root
 
     def _generate_output_path(self, input_file: Path) -> Path:
         """Generate output filename with _480p suffix.
@@ -116,112 +384,237 @@ class BatchConverter:
             Path("output/movies/avatar_480p.mp4")
         """
         relative_path: Path = input_file.relative_to(self.config.input_folder)
-        output_name: str = f"{input_file.stem}_{self.config.video.resolution}p.mp4"
+        output_name: str = self._output_basename(input_file.name)
         output_path: Path = self.config.output_folder / relative_path.parent / output_name
 
         # Create subdirectories if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_path.parent not in self._ensured_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_path.parent)
 
         return output_path
 
-    def _build_ffmpeg_command(self, input_file: Path, output_file: Path) -> list[str]:
+    def _build_ffmpeg_command(
+        self, input_file: Path, output_file: Path, threads: int | None = None
+    ) -> list[str]:
         """Construct FFmpeg command for conversion.
 
         Args:
             input_file: Path to the input MKV file
             output_file: Path to the output MP4 file
+            threads: Optional cap on FFmpeg encoder threads
 
         Returns:
             list[str]: FFmpeg command as list of arguments
         """
+        if self._encode_args is None:
+            self._prepare_encoder_args()
+
+        # Burn subtitles before scaling if enabled
+        if self.config.subtitles.enabled:
+            vf_filter = (
+                f"subtitles={_escape_filter_path(input_file)}"
+                f"{self._subtitle_options},{self._scale_filter}"
+            )
+        else:
+            vf_filter = self._scale_filter
+
         cmd: list[str] = [
             "ffmpeg",
+            *self._input_args,
             "-i", str(input_file),
+            "-vf", vf_filter,
+            *self._encode_args,
         ]
 
-        # Add subtitle filter if enabled
+        if threads is not None:
+            cmd.extend(["-threads", str(threads)])
+
+        cmd.extend([
+            "-y",  # Overwrite output file if exists
+            str(output_file)
+        ])
+
+        return cmd
+
+    def _can_copy_video(self, input_file: Path) -> bool:
+        """Check whether the input video stream already matches the target.
+
+        Only possible when no subtitles are burned in, since that needs a
+        re-encode. The input must already be in the configured codec's
+        family at the target height.
+
+        Args:
+            input_file: Path to the input MKV file
+
+        Returns:
+            bool: True if the video stream can be copied without re-encoding
+        """
         if self.config.subtitles.enabled:
-            # Build subtitle filter
-            subtitle_filter = f"subtitles={input_file}"
+            return False
 
-            # Add language specification if provided
-            if self.config.subtitles.language:
-                subtitle_filter += f":si={self.config.subtitles.language}"
+        info = get_video_info(input_file)
+        if not info:
+            logger.debug(f"Could not probe {input_file.name}, re-encoding the video")
+            return False
+        return (
+            info.get("codec_name") == _CODEC_FAMILIES[self.config.video.codec]
+            and info.get("height") == str(self.config.video.resolution)
+        )
 
-            # Add custom style if provided
-            if self.config.subtitles.force_style:
-                subtitle_filter += f":force_style='{self.config.subtitles.force_style}'"
+    def _can_copy_audio(self, input_file: Path) -> bool:
+        """Check whether the input audio stream already matches the target.
 
-            # Combine with scale filter
-            vf_filter = f"{subtitle_filter},scale=-2:{self.config.video.resolution}"
-        else:
-            vf_filter = f"scale=-2:{self.config.video.resolution}"
+        The codec must be the configured one and the bitrate no higher than
+        the configured bitrate. MKV audio often has no bitrate on record; a
+        matching codec is accepted then.
 
-        cmd.extend([
-            "-vf", vf_filter,
-            "-vcodec", self.config.video.codec,
-            "-acodec", self.config.audio.codec,
-            "-crf", str(self.config.video.crf),
-            "-preset", self.config.video.preset,
-            "-b:a", self.config.audio.bitrate,
+        Args:
+            input_file: Path to the input MKV file
+
+        Returns:
+            bool: True if the audio stream can be copied without re-encoding
+        """
+        info = get_audio_info(input_file)
+        if not info:
+            logger.debug(f"Could not probe audio of {input_file.name}, re-encoding it")
+            return False
+        if info.get("codec_name") != self.config.audio.codec:
+            return False
+        bit_rate = info.get("bit_rate", "")
+        return not bit_rate.isdigit() or int(bit_rate) <= self._audio_bitrate_bps
+
+    def _build_remux_command(
+        self, input_file: Path, output_file: Path, copy_audio: bool = False
+    ) -> list[str]:
+        """Construct FFmpeg command that copies the video stream into MP4.
+
+        Args:
+            input_file: Path to the input MKV file
+            output_file: Path to the output MP4 file
+            copy_audio: Copy the audio stream too instead of re-encoding it
+
+        Returns:
+            list[str]: FFmpeg command as list of arguments
+        """
+        return [
+            "ffmpeg",
+            "-i", str(input_file),
+            "-c:v", "copy",
+            *(self._audio_copy_args if copy_audio else self._audio_encode_args),
             "-movflags", "+faststart",
             "-y",  # Overwrite output file if exists
-            str(output_file)
-        ])
+            str(output_file),
+        ]
 
-        return cmd
+    def _run_ffmpeg(self, cmd: list[str]) -> None:
+        """Run FFmpeg, streaming its stderr instead of buffering all of it.
+
+        Only the last lines of stderr are kept for error reporting, so
+        memory stays bounded on long encodes. In verbose mode every line is
+        also logged at DEBUG level.
 
-    def process_file(self, input_file: Path) -> ConversionResult:
+        Args:
+            cmd: FFmpeg command as list of arguments
+
+        Raises:
+            subprocess.CalledProcessError: If FFmpeg exits with a non-zero
+                status; ``stderr`` holds the tail of its output
+        """
+        tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        verbose: bool = self.config.verbose
+
+        # No stdin: FFmpeg's interactive key handling would otherwise grab the
+        # terminal, racing other concurrent runs and the menu's input() prompts
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        ) as proc:
+            for line in proc.stderr:
+                line = line.rstrip("\n")
+                tail.append(line)
+                if verbose:
+                    logger.debug(line)
+
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr="\n".join(tail))
+
+    def process_file(
+        self, input_file: Path, threads: int | None = None, size_bytes: int | None = None
+    ) -> ConversionResult:
         """Process a single MKV file.
 
         Args:
             input_file: Path to the MKV file to convert
+            threads: Optional cap on FFmpeg encoder threads, used when several
+                files are converted concurrently
+            size_bytes: Input size if already known (e.g. from a scandir
+                entry), saving a stat() call
 
         Returns:
             ConversionResult: Object containing conversion results and metadata
         """
-        start_time: datetime = datetime.now()
+        start_time: float = time.perf_counter()
         output_file: Path = self._generate_output_path(input_file)
 
         # Skip if output already exists and skip_existing is True
-        if self.config.skip_existing and output_file.exists():
-            logger.info(f"Skipping {input_file.name} (already converted)")
-            return ConversionResult(
-                input_file=input_file,
-                output_file=output_file,
-                success=True,
-                duration_seconds=0,
-                original_size_mb=0,
-                converted_size_mb=output_file.stat().st_size / (1024 * 1024),
-            )
+        if self.config.skip_existing:
+            try:
+                existing_size: int | None = output_file.stat().st_size
+            except OSError:
+                existing_size = None
+            if existing_size is not None:
+                logger.info(f"Skipping {input_file.name} (already converted)")
+                return ConversionResult(
+                    input_file=input_file,
+                    output_file=output_file,
+                    success=True,
+                    duration_seconds=0,
+                    original_size_mb=0,
+                    converted_size_mb=existing_size / _MB,
+                )
+
+        # Filled in from the known size or a single stat; the error paths reuse it
+        original_size_mb: float = 0.0
 
         try:
             # Get original file size
-            original_size_mb: float = input_file.stat().st_size / (1024 * 1024)
-
-            # Build FFmpeg command
-            cmd: list[str] = self._build_ffmpeg_command(input_file, output_file)
-
-            logger.info(f"Converting: {input_file.name}")
+            if size_bytes is None:
+                size_bytes = input_file.stat().st_size
+            original_size_mb = size_bytes / _MB
+
+            # Build FFmpeg command, copying the video if it needs no re-encode
+            if self._can_copy_video(input_file):
+                cmd: list[str] = self._build_remux_command(
+                    input_file, output_file, self._can_copy_audio(input_file)
+                )
+                logger.info(f"Remuxing: {input_file.name} (video already matches target)")
+            else:
+                cmd = self._build_ffmpeg_command(input_file, output_file, threads)
+                logger.info(f"Converting: {input_file.name}")
             if self.config.verbose:
                 logger.debug(f"FFmpeg command: {' '.join(cmd)}")
 
             # Execute FFmpeg
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._run_ffmpeg(cmd)
 
             # Calculate duration
-            duration: float = (datetime.now() - start_time).total_seconds()
+            duration: float = time.perf_counter() - start_time
 
             # Validate output
-            if not output_file.exists() or output_file.stat().st_size == 0:
+            try:
+                converted_size: int = output_file.stat().st_size
+            except FileNotFoundError:
+                converted_size = 0
+            if converted_size == 0:
                 raise ValueError("Output file is missing or empty")
 
-            converted_size_mb: float = output_file.stat().st_size / (1024 * 1024)
+            converted_size_mb: float = converted_size / _MB
 
             # Log success with extra context
             logger.success(
@@ -245,8 +638,8 @@ class BatchConverter:
                 input_file=input_file,
                 output_file=output_file,
                 success=False,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
-                original_size_mb=input_file.stat().st_size / (1024 * 1024),
+                duration_seconds=time.perf_counter() - start_time,
+                original_size_mb=original_size_mb,
                 converted_size_mb=0,
                 error_message=str(e.stderr)
             )
@@ -256,21 +649,59 @@ class BatchConverter:
                 input_file=input_file,
                 output_file=output_file,
                 success=False,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
-                original_size_mb=input_file.stat().st_size / (1024 * 1024),
+                duration_seconds=time.perf_counter() - start_time,
+                original_size_mb=original_size_mb,
                 converted_size_mb=0,
                 error_message=str(e)
             )
 
+    def plan_workers(self, file_count: int) -> tuple[int, int]:
+        """Split the CPU cores between concurrent conversions.
+
+        Args:
+            file_count: Number of files to convert
+
+        Returns:
+            tuple[int, int]: Conversions to run at once, and FFmpeg threads for each
+        """
+        workers: int = max(1, min(self.config.max_workers, file_count))
+        threads: int = max(1, (os.cpu_count() or 1) // workers)
+        return workers, threads
+
+    def conversion_pool(self, workers: int) -> ThreadPoolExecutor:
+        """Create the executor that runs process_file() concurrently.
+
+        Threads are enough since each conversion waits on an FFmpeg
+        subprocess, and unlike worker processes they share the loguru sinks
+        the caller set up, so per-file success and error records are kept.
+
+        Args:
+            workers: Conversions to run at once
+
+        Returns:
+            ThreadPoolExecutor: Executor to submit process_file calls to
+        """
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="convert")
+
     def process_all(self, mkv_files: list[Path]) -> list[ConversionResult]:
         """Process all MKV files.
 
+        With ``parallel_processing`` enabled, up to ``max_workers`` files are
+        converted at once on conversion_pool() and each FFmpeg run is limited
+        to an equal share of the CPU cores (see plan_workers()).
+
         Args:
             mkv_files: List of MKV file paths to process
 
         Returns:
-            list[ConversionResult]: List of conversion results
+            list[ConversionResult]: List of conversion results, in input order
         """
+        workers, threads = self.plan_workers(len(mkv_files))
+        if self.config.parallel_processing and workers > 1:
+            logger.info(f"Converting {len(mkv_files)} file(s) with {workers} workers, {threads} FFmpeg thread(s) each")
+            with self.conversion_pool(workers) as executor:
+                return list(executor.map(self.process_file, mkv_files, repeat(threads)))
+
         results: list[ConversionResult] = []
 
         for mkv_file in mkv_files:
@@ -286,34 +717,47 @@ class BatchConverter:
             results: List of conversion results to summarize
         """
         total_files: int = len(results)
-        successful: int = sum(1 for r in results if r.success)
-        failed: int = total_files - successful
 
-        total_original_size: float = sum(r.original_size_mb for r in results)
-        total_converted_size: float = sum(r.converted_size_mb for r in results)
+        # Gather all totals in one pass over the results
+        total_original_size: float = 0
+        total_converted_size: float = 0
+        total_time: float = 0
+        failures: list[ConversionResult] = []
+        for r in results:
+            total_original_size += r.original_size_mb
+            total_converted_size += r.converted_size_mb
+            total_time += r.duration_seconds
+            if not r.success:
+                failures.append(r)
+
+        failed: int = len(failures)
+        successful: int = total_files - failed
         space_saved: float = total_original_size - total_converted_size
         space_saved_percent: float = (space_saved / total_original_size * 100) if total_original_size > 0 else 0
 
-        total_time: float = sum(r.duration_seconds for r in results)
-
-        # Print summary
-        print("\n" + "="*50)
-        print("     CONVERSION SUMMARY REPORT")
-        print("="*50)
-        print(f"\nTotal Files Processed:  {total_files}")
-        print(f"✅ Successful:          {successful}")
-        print(f"❌ Failed:              {failed}")
-        print(f"⏱️  Total Time:         {self._format_duration(total_time)}")
-        print(f"\nOriginal Total Size:    {total_original_size:.2f} MB")
-        print(f"Converted Total Size:   {total_converted_size:.2f} MB")
-        print(f"Space Saved:            {space_saved:.2f} MB ({space_saved_percent:.1f}%)")
+        # Render the report, then print it with a single write
+        parts: list[str] = [
+            "\n" + "="*50,
+            "     CONVERSION SUMMARY REPORT",
+            "="*50,
+            f"\nTotal Files Processed:  {total_files}",
+            f"✅ Successful:          {successful}",
+            f"❌ Failed:              {failed}",
+            f"⏱️  Total Time:         {self._format_duration(total_time)}",
+            f"\nOriginal Total Size:    {total_original_size:.2f} MB",
+            f"Converted Total Size:   {total_converted_size:.2f} MB",
+            f"Space Saved:            {space_saved:.2f} MB ({space_saved_percent:.1f}%)",
+        ]
 
         if failed > 0:
-            print("\nFailed Files:")
-            for i, result in enumerate([r for r in results if not r.success], 1):
-                print(f"  {i}. {result.input_file.name} - {result.error_message}")
+            parts.append("\nFailed Files:")
+            parts.extend(
+                f"  {i}. {result.input_file.name} - {result.error_message}"
+                for i, result in enumerate(failures, 1)
+            )
 
-        print("="*50 + "\n")
+        parts.append("="*50 + "\n")
+        sys.stdout.write("\n".join(parts) + "\n")
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
@@ -325,12 +769,10 @@ class BatchConverter:
         Returns:
             str: Formatted duration string (e.g., "2h 15m 30s")
         """
-        mins, secs = divmod(int(seconds), 60)
-        hours, mins = divmod(mins, 60)
+        total = int(seconds)
+        hours, rem = total // 3600, total % 3600
+        mins, secs = rem // 60, rem % 60
 
         if hours > 0:
             return f"{hours}h {mins}m {secs}s"
-        elif mins > 0:
-            return f"{mins}m {secs}s"
-        else:
-            return f"{secs}s"
+        return f"{mins}m {secs}s" if mins > 0 else f"{secs}s"
@@ -1,17 +1,49 @@
 """Helper utilities for video processing."""
 
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence, TypeVar
 from loguru import logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib parser is fine for small outputs
+    from json import loads as _json_loads
+
+_PathT = TypeVar("_PathT", str, Path)
+
 
 def validate_ffmpeg() -> bool:
     """Check if FFmpeg is installed and accessible.
 
+    Shares one cached ``ffmpeg -version`` run with get_ffmpeg_version();
+    call clear_probe_caches() after installing FFmpeg.
+
     Returns:
         bool: True if FFmpeg is installed and working, False otherwise
     """
+    return _probe_ffmpeg() is not None
+
+
+def get_ffmpeg_version() -> Optional[str]:
+    """Get FFmpeg version string (shares the validate_ffmpeg probe).
+
+    Returns:
+        Optional[str]: FFmpeg version string or None if not found
+    """
+    return _probe_ffmpeg()
+
+
+@lru_cache(maxsize=1)
+def _probe_ffmpeg() -> Optional[str]:
+    """Run ``ffmpeg -version`` once and return the first output line.
+
+    Returns:
+        Optional[str]: FFmpeg version line, or None if FFmpeg is unavailable
+    """
     try:
         result = subprocess.run(
             ["ffmpeg", "-version"],
@@ -20,73 +52,81 @@ def validate_ffmpeg() -> bool:
             check=True,
             timeout=10
         )
-
-        # Extract FFmpeg version from output
-        version_line = result.stdout.split('\n')[0]
-        logger.info(f"FFmpeg found: {version_line}")
-
-        return True
     except subprocess.CalledProcessError as e:
         logger.error(f"FFmpeg command failed: {e.stderr}")
-        return False
+        return None
     except FileNotFoundError:
         logger.error("FFmpeg not found in system PATH")
-        return False
+        return None
     except subprocess.TimeoutExpired:
         logger.error("FFmpeg command timed out")
-        return False
+        return None
     except Exception as e:
         logger.error(f"Unexpected error validating FFmpeg: {e}")
-        return False
+        return None
 
+    # Extract FFmpeg version from output
+    version_line = result.stdout.split('\n')[0]
+    logger.info(f"FFmpeg found: {version_line}")
+
+    return version_line
 
-def get_ffmpeg_version() -> Optional[str]:
-    """Get FFmpeg version string.
+
+@lru_cache(maxsize=1)
+def validate_ffprobe() -> bool:
+    """Check if FFprobe is installed and accessible (cached, see clear_probe_caches).
 
     Returns:
-        Optional[str]: FFmpeg version string or None if not found
+        bool: True if FFprobe is installed and working, False otherwise
     """
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
+        subprocess.run(
+            ["ffprobe", "-version"],
             capture_output=True,
             text=True,
             check=True,
             timeout=10
         )
 
-        # Extract version from first line
-        version_line = result.stdout.split('\n')[0]
-        return version_line
-    except Exception:
-        return None
+        logger.info("FFprobe found and validated")
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        logger.warning("FFprobe not found or not working")
+        return False
 
 
-def validate_ffprobe() -> bool:
-    """Check if FFprobe is installed and accessible.
+@lru_cache(maxsize=1)
+def get_available_encoders() -> frozenset[str]:
+    """List the encoders this FFmpeg build provides (cached).
 
     Returns:
-        bool: True if FFprobe is installed and working, False otherwise
+        frozenset[str]: Encoder names, empty if FFmpeg can't be run
     """
     try:
         result = subprocess.run(
-            ["ffprobe", "-version"],
+            ["ffmpeg", "-hide_banner", "-encoders"],
             capture_output=True,
             text=True,
             check=True,
             timeout=10
         )
-
-        logger.info("FFprobe found and validated")
-        return True
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        logger.warning("FFprobe not found or not working")
-        return False
+        logger.warning("Could not list FFmpeg encoders")
+        return frozenset()
 
+    # Encoder rows follow a "------" line: " V....D libx264   description"
+    _, _, table = result.stdout.partition("------")
+    return frozenset(
+        fields[1] for fields in map(str.split, table.splitlines()) if len(fields) >= 2
+    )
 
-def get_video_info(video_path: Path) -> dict[str, str]:
+
+def get_video_info(video_path: str | Path) -> dict[str, str]:
     """Extract video metadata using ffprobe.
 
+    Results are cached on the file's path, mtime and size, so probing an
+    unchanged file again does not start another ffprobe process.
+
     Args:
         video_path: Path to the video file
 
@@ -94,31 +134,136 @@ def get_video_info(video_path: Path) -> dict[str, str]:
         dict[str, str]: Dictionary containing video metadata
     """
     try:
-        cmd: list[str] = [
-            "ffprobe",
-            "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "stream=width,height,codec_name,duration",
-            "-of", "default=noprint_wrappers=1",
-            str(video_path)
-        ]
+        stat = os.stat(video_path)
+    except OSError as e:
+        logger.error(f"Failed to get video info for {video_path}: {e}")
+        return {}
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
+    # Copy so callers can't modify the cached entry
+    return dict(_probe_video_info(str(video_path), stat.st_mtime_ns, stat.st_size))
+
+
+def get_video_infos(video_paths: Sequence[_PathT]) -> dict[_PathT, dict[str, str]]:
+    """Extract video metadata for several files with concurrent ffprobe runs.
+
+    ffprobe handles one file per process, so instead of probing files one
+    after another the runs are spread over a small thread pool and their
+    start-up costs overlap.
+
+    Args:
+        video_paths: Paths of the video files (str or Path)
+
+    Returns:
+        dict[_PathT, dict[str, str]]: Metadata per given path (empty on failure)
+    """
+    if len(video_paths) <= 1:
+        return {path: get_video_info(path) for path in video_paths}
+
+    workers = min(8, os.cpu_count() or 1, len(video_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(video_paths, executor.map(get_video_info, video_paths)))
+
+
+@lru_cache(maxsize=1024)
+def _probe_video_info(video_path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Run ffprobe on a file's video stream, memoized on its stat signature.
 
-        # Parse output
-        info: dict[str, str] = {}
-        for line in result.stdout.split("\n"):
-            if "=" in line:
-                key, value = line.split("=", 1)
-                info[key] = value
+    Args:
+        video_path: Path to the video file
+        mtime_ns: Modification time of the file in nanoseconds (cache key only)
+        size: Size of the file in bytes (cache key only)
 
-        return info
+    Returns:
+        dict[str, str]: Dictionary containing video metadata (shared, do not mutate)
+    """
+    try:
+        return _probe_stream(video_path, "v:0", "width,height,codec_name,duration")
     except Exception as e:
         logger.error(f"Failed to get video info for {video_path}: {e}")
         return {}
+
+
+def get_audio_info(video_path: str | Path) -> dict[str, str]:
+    """Extract metadata of a file's first audio stream using ffprobe.
+
+    Cached like get_video_info(). ``bit_rate`` is often missing for MKV
+    audio, since Matroska doesn't store it per stream.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        dict[str, str]: codec_name and, when known, bit_rate (empty on failure)
+    """
+    try:
+        stat = os.stat(video_path)
+    except OSError as e:
+        logger.error(f"Failed to get audio info for {video_path}: {e}")
+        return {}
+
+    # Copy so callers can't modify the cached entry
+    return dict(_probe_audio_info(str(video_path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=1024)
+def _probe_audio_info(video_path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Run ffprobe on a file's audio stream, memoized on its stat signature.
+
+    Args:
+        video_path: Path to the video file
+        mtime_ns: Modification time of the file in nanoseconds (cache key only)
+        size: Size of the file in bytes (cache key only)
+
+    Returns:
+        dict[str, str]: Dictionary containing audio metadata (shared, do not mutate)
+    """
+    try:
+        return _probe_stream(video_path, "a:0", "codec_name,bit_rate")
+    except Exception as e:
+        logger.error(f"Failed to get audio info for {video_path}: {e}")
+        return {}
+
+
+def _probe_stream(video_path: str, stream: str, entries: str) -> dict[str, str]:
+    """Run ffprobe for a single stream of a file.
+
+    Args:
+        video_path: Path to the video file
+        stream: ffprobe stream specifier, e.g. "v:0"
+        entries: Comma-separated stream fields to report
+
+    Returns:
+        dict[str, str]: Reported fields (empty if the file has no such stream)
+
+    Raises:
+        subprocess.CalledProcessError: If ffprobe fails
+    """
+    cmd: list[str] = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", stream,
+        "-show_entries", f"stream={entries}",
+        "-of", "json",
+        video_path
+    ]
+
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        check=True,
+        timeout=30
+    )
+
+    # Parse the JSON bytes; numbers are turned back into strings to keep
+    # the same values the key=value output used to give
+    streams = _json_loads(result.stdout).get("streams") or [{}]
+    return {key: str(value) for key, value in streams[0].items()}
+
+
+def clear_probe_caches() -> None:
+    """Forget cached FFmpeg/FFprobe results, e.g. after installing FFmpeg."""
+    _probe_ffmpeg.cache_clear()
+    get_available_encoders.cache_clear()
+    validate_ffprobe.cache_clear()
+    _probe_video_info.cache_clear()
+    _probe_audio_info.cache_clear()
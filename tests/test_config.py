@@ -1 +1,44 @@
 """Unit tests for configuration management."""
+
+import pytest
+
+from scripts.config_manager import _assign_validated
+from src.config import AudioConfig, VideoConfig
+
+
+@pytest.mark.parametrize("value", ["128", "fast", "128kbps", "k"])
+def test_invalid_bitrate_message_explains_format(value, capsys):
+    """A rejected bitrate shows the expected format, not the regex."""
+    audio = AudioConfig()
+
+    assert not _assign_validated(audio, "bitrate", value)
+
+    out = capsys.readouterr().out
+    assert out == (
+        f"✗ Invalid bitrate format '{value}'. Use a number ending with 'k' or 'M' "
+        "(e.g., '128k', '0.5M'). Keeping current value.\n"
+    )
+    assert "^" not in out
+    assert audio.bitrate == "128k"
+
+
+@pytest.mark.parametrize("value", ["192k", "0.5M"])
+def test_valid_bitrate_is_assigned(value, capsys):
+    """An accepted bitrate is assigned without printing anything."""
+    audio = AudioConfig()
+
+    assert _assign_validated(audio, "bitrate", value)
+
+    assert audio.bitrate == value
+    assert capsys.readouterr().out == ""
+
+
+def test_invalid_choice_uses_pydantic_message(capsys):
+    """Fields without a pattern keep pydantic's own message."""
+    video = VideoConfig()
+
+    assert not _assign_validated(video, "preset", "warp")
+
+    out = capsys.readouterr().out
+    assert out.startswith("✗ Input should be 'ultrafast'")
+    assert video.preset == "medium"
@@ -1 +1,263 @@
 """Unit tests for converter module."""
+
+import os
+from pathlib import Path, PureWindowsPath
+
+import pytest
+from loguru import logger
+
+import src.converter
+from src.config import Config
+from src.converter import BatchConverter
+
+
+@pytest.fixture
+def converter(tmp_path):
+    """A converter whose input, output and logs folders live under tmp_path."""
+    config = Config(
+        input_folder=tmp_path / "input",
+        output_folder=tmp_path / "output",
+        logs_folder=tmp_path / "logs",
+    )
+    config.input_folder.mkdir()
+    return BatchConverter(config)
+
+
+@pytest.fixture
+def warnings():
+    """Collect the messages loguru logs at WARNING level or above."""
+    messages: list[str] = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]), level="WARNING")
+    yield messages
+    logger.remove(sink_id)
+
+
+def _touch(root: Path, *names: str) -> list[Path]:
+    """Create empty files (and their parent folders) below root."""
+    paths = []
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        paths.append(path)
+    return paths
+
+
+def test_scan_finds_mkv_files_in_nested_folders(converter):
+    """Files at any depth are found; other extensions are ignored."""
+    root = converter.config.input_folder
+    expected = _touch(root, "top.mkv", "season 1/ep1.mkv", "season 1/extras/ep1b.mkv")
+    _touch(root, "notes.txt", "season 1/ep1.srt", "season 1/extras/cover.jpg")
+
+    assert converter.scan_input_folder() == sorted(expected)
+
+
+def test_scan_matches_extension_case_insensitively(converter):
+    """Upper- and mixed-case .mkv extensions are found too."""
+    root = converter.config.input_folder
+    expected = _touch(root, "a.MKV", "b.Mkv", "sub/c.mkv")
+
+    assert converter.scan_input_folder() == sorted(expected)
+
+
+def test_scan_skips_hidden_files_and_folders(converter):
+    """Hidden files and everything under a hidden folder are skipped."""
+    root = converter.config.input_folder
+    expected = _touch(root, "show.mkv")
+    _touch(root, ".partial.mkv", ".cache/show.mkv")
+
+    assert converter.scan_input_folder() == expected
+
+
+def test_scan_skips_unreadable_folder_with_warning(converter, monkeypatch, warnings):
+    """A folder that can't be listed is skipped; the rest is still scanned."""
+    root = converter.config.input_folder
+    expected = _touch(root, "a.mkv", "open/b.mkv")
+    _touch(root, "locked/c.mkv")
+    locked = str(root / "locked")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if path == locked:
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    # Root can read any folder regardless of its mode, so fail the listing directly
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    assert converter.scan_input_folder() == sorted(expected)
+    assert len(warnings) == 1
+    assert warnings[0].startswith(f"Skipping unreadable folder {locked}: ")
+
+
+def test_scan_order_matches_sorted_paths(converter):
+    """Results come in sorted(Path) order, comparing path components.
+
+    A plain string sort would put "a-b.mkv" before "a/..." since '-' sorts
+    before '/'; sorted(Path) compares "a" with "a-b.mkv" first instead.
+    """
+    root = converter.config.input_folder
+    paths = _touch(
+        root, "b.mkv", "a-b.mkv", "a/z.mkv", "a/b/c.mkv", "A.mkv", "a b/x.mkv", "a.mkv"
+    )
+
+    result = converter.scan_input_folder()
+
+    assert result == sorted(paths)
+    assert [p.relative_to(root).as_posix() for p in result] == [
+        "A.mkv", "a/b/c.mkv", "a/z.mkv", "a b/x.mkv", "a-b.mkv", "a.mkv", "b.mkv",
+    ]
+
+
+def test_scan_missing_input_folder_returns_empty(converter):
+    """A missing input folder gives no files rather than an error."""
+    converter.config.input_folder.rmdir()
+
+    assert converter.scan_input_folder() == []
+
+
+@pytest.mark.parametrize(
+    ("input_file", "escaped"),
+    [
+        (Path("input/show.mkv"), "input/show.mkv"),
+        (Path("input/It's.mkv"), r"input/It\\\'s.mkv"),
+        (Path("input/12:30.mkv"), r"input/12\\:30.mkv"),
+        (Path("input/a,b.mkv"), r"input/a\,b.mkv"),
+        (Path("input/[Group] Show.mkv"), r"input/\[Group\] Show.mkv"),
+        (Path("input/a;b.mkv"), r"input/a\;b.mkv"),
+        (PureWindowsPath(r"C:\Videos\show.mkv"), r"C\\:\\\\Videos\\\\show.mkv"),
+    ],
+    ids=["plain", "quote", "colon", "comma", "brackets", "semicolon", "windows-drive"],
+)
+def test_subtitle_filter_escapes_input_path(converter, input_file, escaped):
+    """The subtitles= path is escaped for both the option and the filtergraph."""
+    cmd = converter._build_ffmpeg_command(input_file, Path("out.mp4"))
+
+    assert cmd[cmd.index("-vf") + 1] == f"subtitles={escaped},scale=-2:480"
+    # The input itself is passed to -i unescaped
+    assert cmd[cmd.index("-i") + 1] == str(input_file)
+
+
+_H264_480P = {"codec_name": "h264", "width": "854", "height": "480"}
+_AAC = {"codec_name": "aac", "bit_rate": "128000"}
+
+
+@pytest.fixture
+def run_file(converter, monkeypatch):
+    """Process one input file with stubbed probes, returning the FFmpeg command.
+
+    get_video_info/get_audio_info return the given metadata and the FFmpeg
+    run only records its command and writes a placeholder output file.
+    """
+    def run(video_info, audio_info, probed=None):
+        def probe(info):
+            def stub(path):
+                if probed is not None:
+                    probed.append(Path(path))
+                return info
+            return stub
+
+        monkeypatch.setattr(src.converter, "get_video_info", probe(video_info))
+        monkeypatch.setattr(src.converter, "get_audio_info", probe(audio_info))
+
+        commands: list[list[str]] = []
+
+        def run_ffmpeg(cmd):
+            commands.append(cmd)
+            Path(cmd[-1]).write_bytes(b"mp4")
+
+        monkeypatch.setattr(converter, "_run_ffmpeg", run_ffmpeg)
+
+        (input_file,) = _touch(converter.config.input_folder, "show.mkv")
+        result = converter.process_file(input_file)
+
+        assert result.success, result.error_message
+        assert len(commands) == 1
+        return commands[0]
+
+    return run
+
+
+def _is_full_encode(cmd: list[str]) -> bool:
+    return "-vf" in cmd and cmd[cmd.index("-vcodec") + 1] == "libx264"
+
+
+def test_burned_in_subtitles_always_encode(run_file):
+    """With subtitles on, even a matching video is re-encoded, without probing it."""
+    probed: list[Path] = []
+
+    cmd = run_file(_H264_480P, _AAC, probed)
+
+    assert _is_full_encode(cmd)
+    assert cmd[cmd.index("-vf") + 1].startswith("subtitles=")
+    assert "copy" not in cmd
+    assert probed == []
+
+
+def test_matching_video_and_audio_are_copied(converter, run_file):
+    """Without subtitles, matching video and audio streams are both copied."""
+    converter.config.subtitles.enabled = False
+
+    cmd = run_file(_H264_480P, _AAC)
+
+    output_file = str(converter._generate_output_path(converter.config.input_folder / "show.mkv"))
+    assert cmd == [
+        "ffmpeg",
+        "-i", str(converter.config.input_folder / "show.mkv"),
+        "-c:v", "copy",
+        "-c:a", "copy",
+        "-movflags", "+faststart",
+        "-y", output_file,
+    ]
+
+
+def test_matching_audio_without_bitrate_is_copied(converter, run_file):
+    """MKV audio often has no bitrate on record; the codec alone decides then."""
+    converter.config.subtitles.enabled = False
+
+    cmd = run_file(_H264_480P, {"codec_name": "aac"})
+
+    assert cmd[cmd.index("-c:a") + 1] == "copy"
+
+
+@pytest.mark.parametrize(
+    "audio_info",
+    [
+        {"codec_name": "flac"},
+        {"codec_name": "opus", "bit_rate": "96000"},
+        {"codec_name": "aac", "bit_rate": "320000"},
+        {},
+    ],
+    ids=["other-codec", "other-codec-lower-bitrate", "higher-bitrate", "probe-failed"],
+)
+def test_non_matching_audio_is_reencoded(converter, run_file, audio_info):
+    """The video is still copied but the audio is encoded to the target."""
+    converter.config.subtitles.enabled = False
+
+    cmd = run_file(_H264_480P, audio_info)
+
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert "-c:a" not in cmd
+    assert cmd[cmd.index("-acodec") + 1] == "aac"
+    assert cmd[cmd.index("-b:a") + 1] == "128k"
+
+
+@pytest.mark.parametrize(
+    "video_info",
+    [
+        {"codec_name": "h264", "height": "1080"},
+        {"codec_name": "hevc", "height": "480"},
+        {},
+    ],
+    ids=["other-height", "other-codec", "probe-failed"],
+)
+def test_non_matching_video_is_encoded(converter, run_file, video_info):
+    """A video that doesn't match the target is encoded, audio included."""
+    converter.config.subtitles.enabled = False
+
+    cmd = run_file(video_info, _AAC)
+
+    assert _is_full_encode(cmd)
+    assert cmd[cmd.index("-vf") + 1] == "scale=-2:480"
+    assert "copy" not in cmd